@@ -1,5 +1,6 @@
 import logging
 import time
+from collections.abc import AsyncIterator, Awaitable, Callable
 from pathlib import Path
 
 import aiohttp
@@ -9,7 +10,8 @@ from discord.ext.commands import Bot
 
 import bot.module.tatsu.data_structures as ds
 from bot import __version__, config
-from bot.module.tatsu.wrapper import ApiWrapper
+from bot.module.tatsu.wrapper import MAX_SERVER_ERROR_RETRIES, ApiWrapper
+from bot.timer import TimerService
 
 logger = logging.getLogger(__name__)
 BOT_PREFIX = config.BOT_PREFIX
@@ -29,6 +31,7 @@ class WarnetBot(Bot):
         )
         self.session: aiohttp.ClientSession = None
         self.version = __version__
+        self.timers = TimerService(self)
 
     async def on_ready(self) -> None:
         print("The bot is online!")
@@ -46,6 +49,7 @@ class WarnetBot(Bot):
             self.owner_ids = {self.bot_app_info.owner.id}
 
         await self.load_cogs()
+        self.timers.start()
 
     async def load_cogs(self) -> None:
         cogs_path = Path("./bot/cogs")
@@ -56,7 +60,9 @@ class WarnetBot(Bot):
         logger.info("ALL COGS HAVE BEEN LOADED SUCCESSFULLY")
 
     async def close(self) -> None:
+        await self.timers.close()
         await self.session.close()
+        await TatsuApi.API.close()
         await super().close()
 
     async def start(
@@ -98,3 +104,14 @@ class TatsuApi:
 
     async def add_score(self, member_id: int, amount: int) -> ds.GuildScoreObject:
         return await self.API.add_score(config.GUILD_ID, member_id, amount)
+
+    def bulk_add_score(
+        self,
+        amounts: dict[int, int],
+        concurrency: int = 5,
+        on_start: Callable[[int], Awaitable[object]] | None = None,
+        retries: int = MAX_SERVER_ERROR_RETRIES,
+    ) -> AsyncIterator[ds.BulkScoreResult]:
+        return self.API.bulk_add_score(
+            config.GUILD_ID, amounts, concurrency, on_start, retries
+        )
@@ -8,7 +8,7 @@ from typing import Literal
 import discord
 from anyio import open_file
 from discord import Interaction, app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 from bot import config
 from bot.bot import WarnetBot
@@ -21,6 +21,8 @@ from bot.helper import (
 
 logger = logging.getLogger(__name__)
 
+SCHEDULED_MESSAGE_TIMER_EVENT = "scheduled_message"
+
 
 @commands.guild_only()
 class Admin(commands.GroupCog, group_name="admin"):
@@ -36,10 +38,13 @@ class Admin(commands.GroupCog, group_name="admin"):
             ephemeral=True,
         )
 
-    @commands.Cog.listener()
-    async def on_connect(self) -> None:
-        if not self._message_schedule_task.is_running():
-            self._message_schedule_task.start()
+    async def cog_load(self) -> None:
+        self.bot.timers.register(
+            SCHEDULED_MESSAGE_TIMER_EVENT, self._send_scheduled_messages
+        )
+
+    async def cog_unload(self) -> None:
+        self.bot.timers.unregister(SCHEDULED_MESSAGE_TIMER_EVENT)
 
     @commands.command()
     @commands.is_owner()
@@ -434,10 +439,7 @@ class Admin(commands.GroupCog, group_name="admin"):
                 date_trigger,
             )
 
-        if self._message_schedule_task.is_running():
-            self._message_schedule_task.restart()
-        else:
-            self._message_schedule_task.start()
+        self.bot.timers.schedule(SCHEDULED_MESSAGE_TIMER_EVENT, date_trigger)
 
         await ctx.send(
             f"⏰ Your message will be triggered in {channel.mention} <t:{int(date_trigger.timestamp())}:R>"
@@ -558,45 +560,44 @@ class Admin(commands.GroupCog, group_name="admin"):
         await ctx.reply(content=content, mention_author=False)
         return
 
-    @tasks.loop()
-    async def _message_schedule_task(self) -> None:
+    async def _send_scheduled_messages(self, now: datetime) -> datetime | None:
+        # canceled messages are already gone from the table
         async with self.db_pool.acquire() as conn:
-            next_task = await conn.fetchrow(
-                "SELECT id, date_trigger FROM scheduled_message ORDER BY date_trigger LIMIT 1;"
+            tasks = await conn.fetch(
+                "SELECT * FROM scheduled_message WHERE date_trigger <= $1 ORDER BY date_trigger;",
+                now,
+            )
+            next_date_trigger = await conn.fetchval(
+                "SELECT MIN(date_trigger) FROM scheduled_message WHERE date_trigger > $1;",
+                now,
             )
 
-        if not next_task:
-            self._message_schedule_task.stop()
+        sent_ids = []
+        for task in tasks:
+            guild = self.bot.get_guild(task["guild_id"])
+            if not guild:
+                logger.error("guild not found", extra={"guild_id": task["guild_id"]})
+                continue
+            target_channel = guild.get_channel(task["channel_id"])
 
-        else:
-            await discord.utils.sleep_until(next_task["date_trigger"])
+            if target_channel:
+                try:
+                    await target_channel.send(content=task["message"])
+                except discord.HTTPException:
+                    logger.exception(
+                        "Failed to send scheduled message",
+                        extra={"scheduled_message_id": task["id"]},
+                    )
+            sent_ids.append(task["id"])
 
+        if sent_ids:
             async with self.db_pool.acquire() as conn:
-                task = await conn.fetchrow(
-                    "SELECT * FROM scheduled_message WHERE id=$1;", next_task["id"]
+                await conn.execute(
+                    "DELETE FROM scheduled_message WHERE id = ANY($1::int[]);",
+                    sent_ids,
                 )
 
-            # task will be None if cancel command is triggered
-            if task:
-                guild = self.bot.get_guild(task["guild_id"])
-                if not guild:
-                    logger.error(
-                        "guild not found", extra={"guild_id": task["guild_id"]}
-                    )
-                    return
-                target_channel = guild.get_channel(task["channel_id"])
-
-                if target_channel:
-                    await target_channel.send(content=task["message"])
-
-                async with self.db_pool.acquire() as conn:
-                    await conn.execute(
-                        "DELETE FROM scheduled_message WHERE id = $1;", task["id"]
-                    )
-
-    @_message_schedule_task.before_loop
-    async def _before_message_schedule_task(self) -> None:
-        await self.bot.wait_until_ready()
+        return next_date_trigger
 
     @staticmethod
     def _parse_relative_time(time_text: str) -> tuple | None:
@@ -2,6 +2,7 @@ import asyncio
 import http
 import io
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 
 import aiohttp
@@ -10,9 +11,12 @@ from discord import Interaction, app_commands
 from discord.ext import commands
 
 from bot.bot import WarnetBot
+from bot.cogs.ext.color.cache import ColorListCache
+from bot.cogs.ext.color.index import CustomRoleNameIndex
 from bot.cogs.ext.color.utils import (
     check_role_by_name_or_number,
     generate_image_color_list,
+    get_color_list_font,
     get_current_custom_role_on_user,
     hex_to_discord_color,
     move_role_to_under_boundary,
@@ -30,7 +34,19 @@ class Color(commands.GroupCog, group_name="warnet-color"):
         self.bot = bot
         self.db_pool = bot.get_db_pool()
         self.custom_role_data: dict[int, int] = {}  # {role_id: owner_discord_id}
-        self.cache = {}
+        self.custom_role_data_list: list[int] = []
+        self.custom_role_ids: frozenset[int] = frozenset()
+        self.owner_custom_role_ids: dict[int, set[int]] = {}  # {owner_id: {role_id}}
+        self.role_name_index = CustomRoleNameIndex()
+        self.member_update_skip_count = 0
+        self.color_list_cache = ColorListCache(
+            CustomRoleConfig.COLOR_LIST_CACHE_DIR,
+            CustomRoleConfig.COLOR_LIST_CACHE_SIZE,
+        )
+        self.render_executor = ThreadPoolExecutor(
+            max_workers=CustomRoleConfig.COLOR_LIST_RENDER_WORKERS,
+            thread_name_prefix="color-render",
+        )
 
     color_add = app_commands.Group(
         name="add", description="Sub command to handle role creation."
@@ -39,6 +55,17 @@ class Color(commands.GroupCog, group_name="warnet-color"):
         name="edit", description="Sub command to handle role editing."
     )
 
+    async def cog_load(self) -> None:
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self.render_executor, get_color_list_font
+            )
+        except OSError:
+            logger.exception("Failed to load color list fonts")
+
+    async def cog_unload(self) -> None:
+        self.render_executor.shutdown(wait=False, cancel_futures=True)
+
     async def cog_command_error(self, ctx: commands.Context, error: Exception) -> None:
         logger.exception("An unexpected error occurred in Admin cog", exc_info=error)
         await ctx.reply(
@@ -55,43 +82,58 @@ class Color(commands.GroupCog, group_name="warnet-color"):
             )
             data_list = [dict(row) for row in records]
 
-        for data in data_list:
-            self.custom_role_data[data["role_id"]] = data["owner_discord_id"]
-        self.custom_role_data_list = list(self.custom_role_data.keys())
+        self._load_custom_roles(
+            {data["role_id"]: data["owner_discord_id"] for data in data_list}
+        )
 
     @commands.Cog.listener()
     async def on_member_update(
         self, before: discord.Member, after: discord.Member
     ) -> None:
-        guild = before.guild
-        booster_role = guild.get_role(CustomRoleConfig.BOOSTER_ROLE_ID)
-        roles_before = set(before.roles)
-        roles_after = set(after.roles)
+        # Only a member losing their booster status matters here, so every other
+        # update is skipped on the raw role id arrays before resolving anything.
+        booster_role_id = CustomRoleConfig.BOOSTER_ROLE_ID
+        if not before._roles.has(booster_role_id) or after._roles.has(booster_role_id):  # noqa: SLF001
+            self.member_update_skip_count += 1
+            return
+
+        role_being_used = get_current_custom_role_on_user(self, after.guild, after)
+        if role_being_used is None:
+            return
 
-        booster_channel = guild.get_channel(CustomRoleConfig.BOOSTER_LOG_CHANNEL_ID)
+        booster_channel = after.guild.get_channel(
+            CustomRoleConfig.BOOSTER_LOG_CHANNEL_ID
+        )
         if booster_channel is None:
             logger.error("booster_channel not found")
             return
 
-        # skip if no role updates on member
-        if not (roles_before ^ roles_after):
-            return
+        await after.remove_roles(role_being_used, reason="Lose Booster Status")
 
-        # Check if a member removed or lost their booster status
-        if booster_role in roles_before and booster_role not in roles_after:
-            role_being_used = get_current_custom_role_on_user(self, after.guild, after)
-            if role_being_used is not None:
-                await after.remove_roles(role_being_used, reason="Lose Booster Status")
-
-                embed = discord.Embed(
-                    color=discord.Color.orange(),
-                    title="Booster member update",
-                    description=(
-                        f"Removed role **{role_being_used.name}** from **{before.mention}**"
-                        f"`({before.id})` due to lost their booster status."
-                    ),
-                )
-                await booster_channel.send(embed=embed)
+        embed = discord.Embed(
+            color=discord.Color.orange(),
+            title="Booster member update",
+            description=(
+                f"Removed role **{role_being_used.name}** from **{before.mention}**"
+                f"`({before.id})` due to lost their booster status."
+            ),
+        )
+        await booster_channel.send(embed=embed)
+
+    @commands.Cog.listener()
+    async def on_guild_available(self, _: discord.Guild) -> None:
+        self._rebuild_role_name_index()
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(
+        self, before: discord.Role, after: discord.Role
+    ) -> None:
+        if after.id in self.custom_role_data and before.name != after.name:
+            self.role_name_index.add(after.id, after.name)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        self.role_name_index.remove(role.id)
 
     @color_add.command(
         name="hex", description="Add a color to the color list using HEX color value."
@@ -143,8 +185,7 @@ class Color(commands.GroupCog, group_name="warnet-color"):
                 role_owner.id,
             )
 
-        self.custom_role_data[created_role.id] = role_owner.id
-        self.custom_role_data_list = list(self.custom_role_data.keys())
+        self._add_custom_role(created_role, role_owner.id)
 
         # Put recent created role under boundary role
         await move_role_to_under_boundary(interaction, created_role)
@@ -159,8 +200,6 @@ class Color(commands.GroupCog, group_name="warnet-color"):
             await role_owner.remove_roles(role_being_used)
         await role_owner.add_roles(created_role)
 
-        self.cache["color-list"] = None
-
         embed = discord.Embed(
             color=valid_color,
             description=f"✅ Successfully created and attached role: **{created_role.name}**.",
@@ -231,8 +270,7 @@ class Color(commands.GroupCog, group_name="warnet-color"):
                 role_owner.id,
             )
 
-        self.custom_role_data[created_role.id] = role_owner.id
-        self.custom_role_data_list = list(self.custom_role_data.keys())
+        self._add_custom_role(created_role, role_owner.id)
 
         # Put recent created role under boundary role
         await move_role_to_under_boundary(interaction, created_role)
@@ -245,8 +283,6 @@ class Color(commands.GroupCog, group_name="warnet-color"):
             await role_owner.remove_roles(role_being_used)
         await role_owner.add_roles(created_role)
 
-        self.cache["color-list"] = None
-
         embed = discord.Embed(
             color=valid_color,
             description=f"✅ Successfully created and attached: **{created_role.name}**.",
@@ -314,8 +350,7 @@ class Color(commands.GroupCog, group_name="warnet-color"):
 
             if edited_role is None:
                 return await value_is_none(value="The role", interaction=interaction)
-
-            self.cache["color-list"] = None
+            self.role_name_index.add(edited_role.id, edited_role.name)
 
             embed = discord.Embed(
                 title="Custom role edited!",
@@ -387,8 +422,7 @@ class Color(commands.GroupCog, group_name="warnet-color"):
             edited_role = await role_target.edit(name=new_name, color=valid_color)
             if edited_role is None:
                 return await value_is_none(value="The role", interaction=interaction)
-
-            self.cache["color-list"] = None
+            self.role_name_index.add(edited_role.id, edited_role.name)
 
             embed = discord.Embed(
                 title="Custom role edited!",
@@ -465,18 +499,12 @@ class Color(commands.GroupCog, group_name="warnet-color"):
                 "❌ Please use the role first.", ephemeral=True
             )
 
-        async with self.db_pool.acquire() as conn:
-            res = await conn.fetchrow(
-                "SELECT owner_discord_id FROM custom_role WHERE role_id=$1;",
-                role.id,
-            )
-
-        if res is None:
+        if role.id not in self.custom_role_ids:
             return await interaction.followup.send(
                 "❌ This role is not a custom role.", ephemeral=True
             )
 
-        if interaction.user.id != res["owner_discord_id"]:
+        if role.id not in self.owner_custom_role_ids.get(interaction.user.id, ()):
             return await interaction.followup.send(
                 "❌ Only the role owner can change the role icon.", ephemeral=True
             )
@@ -541,19 +569,21 @@ class Color(commands.GroupCog, group_name="warnet-color"):
         if interaction.guild is None:
             return None
 
-        role_list = [
-            role
+        rows = [
+            (role.name, role.color.to_rgb())
             for role_id in self.custom_role_data_list
             if (role := interaction.guild.get_role(role_id))
         ]
 
-        if not (image_bytes := self.cache.get("color-list")):
-            image_bytes = generate_image_color_list(role_list)
-            self.cache["color-list"] = image_bytes
+        key = ColorListCache.make_key(rows)
+        if (image := await self.color_list_cache.get(key)) is None:
+            image = await asyncio.get_running_loop().run_in_executor(
+                self.render_executor, generate_image_color_list, rows
+            )
+            await self.color_list_cache.set(key, image)
 
         filename = "custom_roles_list.png"
-        image_bytes.seek(0)  # Reset the position to the beginning of the BytesIO object
-        file = discord.File(image_bytes, filename)
+        file = discord.File(io.BytesIO(image), filename)
         embed = discord.Embed(color=discord.Color.dark_embed())
         embed.set_image(url=f"attachment://{filename}")
 
@@ -643,13 +673,10 @@ class Color(commands.GroupCog, group_name="warnet-color"):
                             "DELETE FROM custom_role WHERE role_id = $1;",
                             role_target.id,
                         )
-                    self.custom_role_data.pop(role_target.id)
-                    self.custom_role_data_list = list(self.custom_role_data.keys())
+                    self._remove_custom_role(role_target.id)
                     await role_target.delete()
                     logger.info("ROLE IS DELETED", extra={"role_id": role_target.id})
 
-                    self.cache["color-list"] = None
-
                     embed = discord.Embed(
                         title="Deleted color!",
                         description=f"Successfully deleted **{role_target.name}** from the list.",
@@ -738,15 +765,15 @@ class Color(commands.GroupCog, group_name="warnet-color"):
             )
             data_list = [dict(row) for row in records]
 
-        self.custom_role_data = {}
-        for data in data_list:
-            if ctx.guild.get_role(data["role_id"]):
-                self.custom_role_data[data["role_id"]] = data["owner_discord_id"]
-        self.custom_role_data_list = list(self.custom_role_data.keys())
+        self._load_custom_roles(
+            {
+                data["role_id"]: data["owner_discord_id"]
+                for data in data_list
+                if ctx.guild.get_role(data["role_id"])
+            }
+        )
         logger.info("ROLE LIST HAS BEEN SYNCED SUCCESSFULLY")
 
-        self.cache["color-list"] = None
-
         await ctx.reply("_Custom roles have been synced_", mention_author=False)
 
     @commands.command(name="colorprune")
@@ -779,6 +806,7 @@ class Color(commands.GroupCog, group_name="warnet-color"):
                         "DELETE FROM custom_role WHERE role_id = $1;",
                         data["role_id"],
                     )
+                    self._remove_custom_role(data["role_id"])
                     deleted_count += 1
 
             for role, role_id in roles_to_remove:
@@ -787,8 +815,7 @@ class Color(commands.GroupCog, group_name="warnet-color"):
                     await conn.execute(
                         "DELETE FROM custom_role WHERE role_id = $1;", role_id
                     )
-                    if role_id in self.custom_role_data:
-                        self.custom_role_data.pop(role_id)
+                    self._remove_custom_role(role_id)
                     logger.info("PRUNED UNUSED ROLE", extra={"role_id": role_id})
                 except Exception:
                     logger.exception(
@@ -796,9 +823,6 @@ class Color(commands.GroupCog, group_name="warnet-color"):
                     )
                     deleted_count -= 1
 
-        self.custom_role_data_list = list(self.custom_role_data.keys())
-        self.cache["color-list"] = None
-
         await ctx.reply(
             f"_Pruned {deleted_count} unused custom roles_", mention_author=False
         )
@@ -888,8 +912,7 @@ class Color(commands.GroupCog, group_name="warnet-color"):
                 role_owner.id,
             )
 
-        self.custom_role_data[created_role.id] = role_owner.id
-        self.custom_role_data_list = list(self.custom_role_data.keys())
+        self._add_custom_role(created_role, role_owner.id)
 
         # Put recent created role under boundary role
         await move_role_to_under_boundary(interaction, created_role)
@@ -902,8 +925,6 @@ class Color(commands.GroupCog, group_name="warnet-color"):
             await role_owner.remove_roles(role_being_used)
         await role_owner.add_roles(created_role)
 
-        self.cache["color-list"] = None
-
         embed = discord.Embed(
             color=valid_color_primary,
             description=f"✅ Successfully created and attached role: **{created_role.name}**.",
@@ -1018,8 +1039,6 @@ class Color(commands.GroupCog, group_name="warnet-color"):
             if edited_role is None:
                 return await value_is_none("The role", interaction=interaction)
 
-        self.cache["color-list"] = None
-
         embed = discord.Embed(
             title="Custom role edited!",
             timestamp=datetime.now(tz=UTC),
@@ -1035,6 +1054,75 @@ class Color(commands.GroupCog, group_name="warnet-color"):
         )
         return await interaction.followup.send(embed=embed)
 
+    @edit_hex_color.autocomplete("role_id_or_name")
+    @edit_rgb_color.autocomplete("role_id_or_name")
+    @edit_hex_gradient_color.autocomplete("role_id_or_name")
+    @set_color.autocomplete("role_id_or_name")
+    @info_color.autocomplete("role_id_or_name")
+    @delete_color.autocomplete("role_id_or_name")
+    async def _custom_role_autocomplete(
+        self, _: Interaction, current: str
+    ) -> list[app_commands.Choice[str]]:
+        max_choices = 25
+        max_choice_len = 100
+
+        if current:
+            role_ids = self.role_name_index.search(current, limit=max_choices)
+        else:
+            role_ids = self.custom_role_data_list[:max_choices]
+
+        numbers = {
+            role_id: number
+            for number, role_id in enumerate(self.custom_role_data_list, start=1)
+        }
+        choices = []
+        for role_id in role_ids:
+            name = self.role_name_index.get_name(role_id)
+            if name is None or role_id not in numbers:
+                continue
+            number = numbers[role_id]
+            choices.append(
+                app_commands.Choice(
+                    name=f"{number}. {name}"[:max_choice_len], value=str(role_id)
+                )
+            )
+
+        return choices
+
+    def _load_custom_roles(self, custom_role_data: dict[int, int]) -> None:
+        self.custom_role_data = custom_role_data
+        self.custom_role_data_list = list(custom_role_data.keys())
+        self.custom_role_ids = frozenset(custom_role_data)
+        self.owner_custom_role_ids = {}
+        for role_id, owner_id in custom_role_data.items():
+            self.owner_custom_role_ids.setdefault(owner_id, set()).add(role_id)
+        self._rebuild_role_name_index()
+
+    def _add_custom_role(self, role: discord.Role, owner_id: int) -> None:
+        self.custom_role_data[role.id] = owner_id
+        self.custom_role_data_list = list(self.custom_role_data.keys())
+        self.custom_role_ids |= {role.id}
+        self.owner_custom_role_ids.setdefault(owner_id, set()).add(role.id)
+        self.role_name_index.add(role.id, role.name)
+
+    def _remove_custom_role(self, role_id: int) -> None:
+        owner_id = self.custom_role_data.pop(role_id, None)
+        self.custom_role_data_list = list(self.custom_role_data.keys())
+        self.custom_role_ids -= {role_id}
+        if (owned := self.owner_custom_role_ids.get(owner_id)) is not None:
+            owned.discard(role_id)
+            if not owned:
+                del self.owner_custom_role_ids[owner_id]
+        self.role_name_index.remove(role_id)
+
+    def _rebuild_role_name_index(self) -> None:
+        self.role_name_index.rebuild(
+            role
+            for guild in self.bot.guilds
+            for role_id in self.custom_role_data
+            if (role := guild.get_role(role_id))
+        )
+
 
 async def setup(bot: WarnetBot) -> None:
     await bot.add_cog(Color(bot))
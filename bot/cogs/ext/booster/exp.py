@@ -1,11 +1,13 @@
-import asyncio
 import http
 import io
 import logging
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
+from functools import partial
 
 import aiohttp
+import asyncpg
 import discord
+import pytz
 
 from bot.bot import TatsuApi, WarnetBot
 from bot.config import (
@@ -16,12 +18,22 @@ from bot.config import (
     GUILD_ID,
     TATSU_LOG_CHANNEL_ID,
 )
+from bot.module.tatsu.wrapper import is_unauthorized
 
 logger = logging.getLogger(__name__)
 
+# booster_payout.status values
+PAYOUT_PENDING = 0
+PAYOUT_DONE = 1
+PAYOUT_FAILED = 2
+PAYOUT_UNCONFIRMED = 3  # sent or in flight with an unknown outcome, check manually
+PAYOUT_BATCH_SIZE = 25
+EMBED_DESCRIPTION_LIMIT = 4096
+
 
 async def give_monthly_booster_exp(bot: WarnetBot) -> None:  # noqa: C901, PLR0912, PLR0915, FIX002 # TODO: improve this
-    today = datetime.now(tz=datetime.UTC).date()
+    today = datetime.now(pytz.timezone("Asia/Jakarta")).date()
+    payout_month = today.replace(day=1)
     logger.info(
         "MONTHLY EXP BOOSTER IS TRIGGERED", extra={"date": today.strftime("%B %Y")}
     )
@@ -36,8 +48,7 @@ async def give_monthly_booster_exp(bot: WarnetBot) -> None:  # noqa: C901, PLR09
     announcement_channel = bot.get_channel(ANNOUNCEMENT_CHANNEL_ID)
     role = guild.get_role(BOOSTER_ROLE_ID)
     month = today.strftime("%B")
-    member_tags = member_ids = member_error = ""
-    success_count = error_count = 0
+    unauthorized = False
 
     if not role:
         logger.error("role not found", extra={"id": BOOSTER_ROLE_ID})
@@ -63,66 +74,111 @@ async def give_monthly_booster_exp(bot: WarnetBot) -> None:  # noqa: C901, PLR09
         )
         return
 
-    for member in role.members:
-        try:
-            await TatsuApi().add_score(member.id, BOOSTER_MONTHLY_EXP)
-
-            success_count += 1
-            member_tags += f"{member.mention}, "
-            member_ids += f"{member.id} "
+    members = {member.id: member for member in role.members}
+    pending_ids = await _prepare_payout(bot.db_pool, payout_month, list(members))
+    if not pending_ids:
+        logger.info("No monthly booster exp left to pay", extra={"month": payout_month})
+        await admin_channel.send(
+            f"Tidak ada exp Honorary bulan {month} yang tersisa untuk dibagikan."
+        )
+        return
 
-        except aiohttp.ClientResponseError as e:
-            if e.status == http.HTTPStatus.UNAUTHORIZED:
-                logger.exception("API key is invalid or expired")
-                await admin_channel.send(
-                    f"403, apikey sudah kadaluwarsa atau tidak valid.\n {success_count} dari {len(role.members)} member berhasil:\n\n{member_tags}"
+    amounts = dict.fromkeys(pending_ids, BOOSTER_MONTHLY_EXP)
+    # rows stay unconfirmed while their request is in flight, so a crash never
+    # leads to paying them twice
+    mark_in_flight = partial(_mark_in_flight, bot.db_pool, payout_month)
+    # {member_id: status} of finished requests, written in batches; rows that are
+    # lost in a crash stay unconfirmed and are never paid again
+    statuses: dict[int, int] = {}
+    try:
+        # a retried request may add the score twice, leave those rows unconfirmed
+        async for result in TatsuApi().bulk_add_score(
+            amounts, on_start=mark_in_flight, retries=0
+        ):
+            member = members[result.user_id]
+            if result.error is None:
+                statuses[member.id] = PAYOUT_DONE
+            elif is_unauthorized(result.error):
+                unauthorized = True
+                statuses[member.id] = PAYOUT_PENDING
+            else:
+                logger.error(
+                    "Failed to add score for",
+                    extra={"member_id": member.id},
+                    exc_info=result.error,
                 )
-                break
-            logger.exception("Failed to add score for", extra={"member_id": member.id})
-            error_count += 1
-            member_error += f"{member.mention}, "
-            continue
-        except Exception:
-            logger.exception("Failed to add score for", extra={"member_id": member.id})
-            error_count += 1
-            member_error += f"{member.mention}, "
-            continue
-
-        await asyncio.sleep(1.5)
-
-    if member_ids:
-        embed = discord.Embed(
-            title="<a:checklist:1077585402422112297> Score updated!",
-            description=f"Successfully awarded `{BOOSTER_MONTHLY_EXP}` score to {role.mention} ({success_count} members)\n\n{member_tags}",
-            timestamp=datetime.now(tz=UTC),
-            color=discord.Color.green(),
-        )
-        embed.set_footer(
-            text=guild.name,
-            icon_url="https://cdn.discordapp.com/attachments/761684443915485184/1038313075260002365/warnet_logo_putih.png",
+                # Tatsu may have applied the score before a timeout or server error
+                statuses[member.id] = (
+                    PAYOUT_UNCONFIRMED
+                    if _outcome_is_unknown(result.error)
+                    else PAYOUT_FAILED
+                )
+
+            if len(statuses) >= PAYOUT_BATCH_SIZE:
+                await _write_payout_statuses(bot.db_pool, payout_month, statuses)
+                statuses.clear()
+    finally:
+        await _write_payout_statuses(bot.db_pool, payout_month, statuses)
+
+    # the report covers the whole month, including members paid by earlier runs
+    paid_ids, failed_ids, unconfirmed_ids = await _fetch_payout_report(
+        bot.db_pool, payout_month
+    )
+
+    if unauthorized:
+        logger.error("API key is invalid or expired")
+        await admin_channel.send(
+            f"403, apikey sudah kadaluwarsa atau tidak valid.\n {len(paid_ids)} dari {len(members)} member berhasil."
         )
-        await tatsu_log_channel.send(embed=embed)
 
-        buffer = io.BytesIO(member_ids.encode("utf-8"))
+    if paid_ids:
+        header = f"Successfully awarded `{BOOSTER_MONTHLY_EXP}` score to {role.mention} ({len(paid_ids)} members)\n\n"
+        for chunk in _chunk_mentions(paid_ids, EMBED_DESCRIPTION_LIMIT - len(header)):
+            embed = discord.Embed(
+                title="<a:checklist:1077585402422112297> Score updated!",
+                description=header + chunk,
+                timestamp=datetime.now(tz=UTC),
+                color=discord.Color.green(),
+            )
+            embed.set_footer(
+                text=guild.name,
+                icon_url="https://cdn.discordapp.com/attachments/761684443915485184/1038313075260002365/warnet_logo_putih.png",
+            )
+            await tatsu_log_channel.send(embed=embed)
+
+        buffer = io.BytesIO(" ".join(map(str, paid_ids)).encode("utf-8"))
         file = discord.File(buffer, filename=f"{month}_honorary.txt")
         await admin_channel.send(
             content=(
-                f"Exp Honorary bulanan sudah dibagikan!\n- Jumlah member berhasil: `{success_count}`\n"
-                f"- Jumlah member error: `{error_count}`\nLog Honorary bulan {month}"
+                f"Exp Honorary bulanan sudah dibagikan!\n- Jumlah member berhasil: `{len(paid_ids)}`\n"
+                f"- Jumlah member error: `{len(failed_ids)}`\nLog Honorary bulan {month}"
             ),
             file=file,
         )
 
-    if member_error:
-        embed = discord.Embed(
-            title="[Monthly Booster] Error handling user",
-            description=f"({error_count} members)\n\n{member_error}",
-            color=discord.Color.red(),
-        )
+    if failed_ids:
+        header = f"({len(failed_ids)} members)\n\n"
+        for chunk in _chunk_mentions(failed_ids, EMBED_DESCRIPTION_LIMIT - len(header)):
+            embed = discord.Embed(
+                title="[Monthly Booster] Error handling user",
+                description=header + chunk,
+                color=discord.Color.red(),
+            )
+            await tatsu_log_channel.send(embed=embed)
 
-        await tatsu_log_channel.send(embed=embed)
+    if unconfirmed_ids:
+        header = f"({len(unconfirmed_ids)} members)\nSkor mungkin sudah masuk, cek manual sebelum membagikan ulang.\n\n"
+        for chunk in _chunk_mentions(
+            unconfirmed_ids, EMBED_DESCRIPTION_LIMIT - len(header)
+        ):
+            embed = discord.Embed(
+                title="[Monthly Booster] Unconfirmed payout",
+                description=header + chunk,
+                color=discord.Color.orange(),
+            )
+            await admin_channel.send(embed=embed)
 
-    if len(role.members) == success_count:
+    if members.keys() <= set(paid_ids):
         await announcement_channel.send(
             f"## Halo {role.mention}!\n\nKami ingin memberi tahu kalian bahwa exp bulan ini sudah dibagikan sebesar **{BOOSTER_MONTHLY_EXP}**.\n"
             f"Terima kasih atas boostnya. Sehat selalu dan sampai jumpa di bulan berikutnya! ❤️"
@@ -132,3 +188,112 @@ async def give_monthly_booster_exp(bot: WarnetBot) -> None:  # noqa: C901, PLR09
         await admin_channel.send(
             "Terdapat error saat memberikan exp bulanan ke Honorary Knight.\n**Announcement gagal dibuat**"
         )
+
+
+async def _prepare_payout(
+    db_pool: asyncpg.Pool, payout_month: date, member_ids: list[int]
+) -> list[int]:
+    """
+    Record every booster for the month and return those still to be paid, so a
+    rerun only pays members that were never paid or definitely failed.
+    """
+    async with db_pool.acquire() as conn:
+        await conn.execute(
+            """
+            INSERT INTO booster_payout (month, member_id)
+            SELECT $1, unnest($2::bigint[])
+            ON CONFLICT (month, member_id) DO NOTHING;
+            """,
+            payout_month,
+            member_ids,
+        )
+        records = await conn.fetch(
+            """
+            SELECT member_id FROM booster_payout
+            WHERE month = $1 AND status = ANY($2::int[]) AND member_id = ANY($3::bigint[]);
+            """,
+            payout_month,
+            [PAYOUT_PENDING, PAYOUT_FAILED],
+            member_ids,
+        )
+
+    return [record["member_id"] for record in records]
+
+
+async def _mark_in_flight(
+    db_pool: asyncpg.Pool, payout_month: date, member_id: int
+) -> None:
+    # written before the request is sent, so it cannot wait for a batch
+    await _write_payout_statuses(db_pool, payout_month, {member_id: PAYOUT_UNCONFIRMED})
+
+
+async def _write_payout_statuses(
+    db_pool: asyncpg.Pool, payout_month: date, statuses: dict[int, int]
+) -> None:
+    if not statuses:
+        return
+
+    async with db_pool.acquire() as conn:
+        await conn.execute(
+            """
+            UPDATE booster_payout AS p SET status = u.status, updated_at = NOW()
+            FROM unnest($2::bigint[], $3::int[]) AS u(member_id, status)
+            WHERE p.month = $1 AND p.member_id = u.member_id;
+            """,
+            payout_month,
+            list(statuses),
+            list(statuses.values()),
+        )
+
+
+def _outcome_is_unknown(error: Exception) -> bool:
+    """
+    Whether the request may have reached Tatsu, as opposed to a clear rejection.
+    """
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status >= http.HTTPStatus.INTERNAL_SERVER_ERROR
+    if isinstance(error, aiohttp.ClientConnectorError):
+        return False
+    return isinstance(error, TimeoutError | aiohttp.ClientConnectionError)
+
+
+async def _fetch_payout_report(
+    db_pool: asyncpg.Pool, payout_month: date
+) -> tuple[list[int], list[int], list[int]]:
+    async with db_pool.acquire() as conn:
+        records = await conn.fetch(
+            """
+            SELECT member_id, status FROM booster_payout
+            WHERE month = $1 AND status <> $2
+            ORDER BY updated_at;
+            """,
+            payout_month,
+            PAYOUT_PENDING,
+        )
+
+    paid_ids = [r["member_id"] for r in records if r["status"] == PAYOUT_DONE]
+    failed_ids = [r["member_id"] for r in records if r["status"] == PAYOUT_FAILED]
+    unconfirmed_ids = [
+        r["member_id"] for r in records if r["status"] == PAYOUT_UNCONFIRMED
+    ]
+    return paid_ids, failed_ids, unconfirmed_ids
+
+
+def _chunk_mentions(member_ids: list[int], limit: int) -> list[str]:
+    """
+    Join member mentions into comma separated chunks no longer than `limit`.
+    """
+    chunks: list[str] = []
+    current: list[str] = []
+    size = 0
+    for member_id in member_ids:
+        mention = f"<@{member_id}>"
+        if current and size + len(mention) + 2 > limit:
+            chunks.append(", ".join(current))
+            current, size = [], 0
+        size += len(mention) + (2 if current else 0)
+        current.append(mention)
+
+    if current:
+        chunks.append(", ".join(current))
+    return chunks
@@ -0,0 +1,79 @@
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+
+from anyio import open_file
+
+logger = logging.getLogger(__name__)
+
+
+class ColorListCache:
+    """
+    LRU cache for rendered color list images.
+    Images are keyed by a hash of the ordered (name, color) rows they show and
+    mirrored on disk, so an unchanged list is never rendered twice, even after
+    a restart.
+    """
+
+    def __init__(self, directory: str, max_size: int) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        # value is None when the image is only stored on disk
+        self._entries: OrderedDict[str, bytes | None] = OrderedDict()
+        for path in sorted(
+            self.directory.glob("*.png"), key=lambda p: p.stat().st_mtime
+        ):
+            self._entries[path.stem] = None
+        self._evict()
+
+    @staticmethod
+    def make_key(rows: Iterable[tuple[str, tuple[int, int, int]]]) -> str:
+        digest = hashlib.sha256()
+        for name, color in rows:
+            digest.update(f"{name}\0{color}\n".encode())
+        return digest.hexdigest()
+
+    async def get(self, key: str) -> bytes | None:
+        if key not in self._entries:
+            self.misses += 1
+            return None
+
+        image = self._entries[key]
+        if image is None:
+            try:
+                async with await open_file(self._path(key), "rb") as f:
+                    image = await f.read()
+            except FileNotFoundError:
+                self._entries.pop(key)
+                self.misses += 1
+                return None
+            self._entries[key] = image
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return image
+
+    async def set(self, key: str, image: bytes) -> None:
+        self._entries[key] = image
+        self._entries.move_to_end(key)
+        self._evict()
+
+        try:
+            async with await open_file(self._path(key), "wb") as f:
+                await f.write(image)
+        except OSError:
+            logger.exception("Failed to write color list cache", extra={"key": key})
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_size:
+            key, _ = self._entries.popitem(last=False)
+            self._path(key).unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.png"
@@ -0,0 +1,119 @@
+import bisect
+from collections.abc import Iterable
+
+from discord import Role
+
+
+class CustomRoleNameIndex:
+    """
+    Name lookup over custom roles only.
+    Lookups are exact first, then case-insensitive. Prefix and trigram search
+    only back autocomplete, never command resolution.
+    """
+
+    def __init__(self) -> None:
+        self._names: dict[int, str] = {}  # {role_id: name}
+        self._exact: dict[str, list[int]] = {}
+        self._folded: dict[str, list[int]] = {}
+        self._sorted_folded: list[str] = []
+        self._trigrams: dict[str, set[int]] = {}
+
+    def __contains__(self, role_id: int) -> bool:
+        return role_id in self._names
+
+    def rebuild(self, roles: Iterable[Role]) -> None:
+        self._names.clear()
+        self._exact.clear()
+        self._folded.clear()
+        self._sorted_folded.clear()
+        self._trigrams.clear()
+        for role in roles:
+            self.add(role.id, role.name)
+
+    def add(self, role_id: int, name: str) -> None:
+        if self._names.get(role_id) == name:
+            return
+
+        self.remove(role_id)
+        self._names[role_id] = name
+        self._exact.setdefault(name, []).append(role_id)
+
+        folded = name.casefold()
+        if folded not in self._folded:
+            bisect.insort(self._sorted_folded, folded)
+        self._folded.setdefault(folded, []).append(role_id)
+        for trigram in _trigrams(folded):
+            self._trigrams.setdefault(trigram, set()).add(role_id)
+
+    def remove(self, role_id: int) -> None:
+        name = self._names.pop(role_id, None)
+        if name is None:
+            return
+
+        self._exact[name].remove(role_id)
+        if not self._exact[name]:
+            del self._exact[name]
+
+        folded = name.casefold()
+        self._folded[folded].remove(role_id)
+        if not self._folded[folded]:
+            del self._folded[folded]
+            index = bisect.bisect_left(self._sorted_folded, folded)
+            del self._sorted_folded[index]
+
+        for trigram in _trigrams(folded):
+            self._trigrams[trigram].discard(role_id)
+            if not self._trigrams[trigram]:
+                del self._trigrams[trigram]
+
+    def get_name(self, role_id: int) -> str | None:
+        return self._names.get(role_id)
+
+    def find(self, name: str) -> int | None:
+        if role_ids := self._exact.get(name):
+            return role_ids[0]
+
+        if role_ids := self._folded.get(name.casefold()):
+            return role_ids[0]
+
+        return None
+
+    def prefix_search(self, prefix: str, limit: int) -> list[int]:
+        prefix = prefix.casefold()
+        result: list[int] = []
+        index = bisect.bisect_left(self._sorted_folded, prefix)
+        while index < len(self._sorted_folded) and len(result) < limit:
+            folded = self._sorted_folded[index]
+            if not folded.startswith(prefix):
+                break
+            result.extend(self._folded[folded])
+            index += 1
+
+        return result[:limit]
+
+    def search(self, query: str, limit: int) -> list[int]:
+        """
+        Return role ids whose name starts with `query`, followed by roles
+        sharing the most trigrams with it.
+        """
+        result = self.prefix_search(query, limit)
+        if len(result) >= limit:
+            return result
+
+        scores: dict[int, int] = {}
+        for trigram in _trigrams(query.casefold()):
+            for role_id in self._trigrams.get(trigram, ()):
+                scores[role_id] = scores.get(role_id, 0) + 1
+
+        seen = set(result)
+        for role_id in sorted(scores, key=scores.__getitem__, reverse=True):
+            if len(result) >= limit:
+                break
+            if role_id not in seen:
+                result.append(role_id)
+
+        return result
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
@@ -1,15 +1,26 @@
+import functools
 import io
 import logging
+import threading
+from collections import OrderedDict
 
 import discord
 from discord import Interaction, Member, Role, User
 from discord.ext import commands
-from imagetext_py import Canvas, Color, FontDB, Paint, draw_text
+from imagetext_py import Canvas, Color, Font, FontDB, Paint, draw_text
+from PIL import Image
 
 from bot.config import CustomRoleConfig
 
 logger = logging.getLogger(__name__)
 
+# Rendered rows of the color list, keyed by (number, name, rgb)
+COLOR_ROW_TILE_CACHE_SIZE = 2 * CustomRoleConfig.CUSTOM_ROLE_LIMIT
+_color_row_tiles: OrderedDict[tuple[int, str, tuple[int, int, int]], Image.Image] = (
+    OrderedDict()
+)
+_color_row_tiles_lock = threading.Lock()
+
 
 async def check_role_by_name_or_number(
     self: commands.Cog,
@@ -22,9 +33,11 @@ async def check_role_by_name_or_number(
 
     role_target = None
     if name:
-        role_target = discord.utils.find(
-            lambda r: r.name == name, interaction.guild.roles
-        )
+        if role_target_id := self.role_name_index.find(name):
+            role_target = interaction.guild.get_role(role_target_id)
+    elif number in self.custom_role_ids:
+        # autocomplete submits the role id, which stays valid if the list shifts
+        role_target = interaction.guild.get_role(number)
     elif number:
         try:
             role_target_id = self.custom_role_data_list[number - 1]
@@ -79,24 +92,31 @@ async def move_role_to_under_boundary(interaction: Interaction, role: Role) -> N
 def get_current_custom_role_on_user(
     self: commands.Cog, guild: discord.Guild, member: User | Member
 ) -> Role | None:
-    member_role_id_list = [role.id for role in member.roles]
-    res = set(member_role_id_list) & set(self.custom_role_data_list)
+    res = self.custom_role_ids.intersection(member._roles)  # noqa: SLF001
 
     return guild.get_role(next(iter(res))) if res else None
 
 
-def generate_image_color_list(role_list: list[discord.Role]) -> io.BytesIO:
+@functools.cache
+def get_color_list_font() -> Font:
     """
-    Generate an image to show the available list of custom roles.
-    There are certain rows per column. Each column has 300px wide.
+    Register the color list fonts and return the shared font handle.
+    Fonts are read from disk only on the first call.
     """
-
     FontDB.LoadFromPath("Noto", CustomRoleConfig.FONT_NOTO)
     FontDB.LoadFromPath("Noto-jp", CustomRoleConfig.FONT_NOTO_JP)
     FontDB.LoadFromPath("Noto-cn", CustomRoleConfig.FONT_NOTO_CN)
-    font = FontDB.Query("Noto Noto-jp Noto-cn")
+    return FontDB.Query("Noto Noto-jp Noto-cn")
+
 
-    total_data = len(role_list)
+def generate_image_color_list(rows: list[tuple[str, tuple[int, int, int]]]) -> bytes:
+    """
+    Generate an image to show the available list of custom roles.
+    There are certain rows per column. Each column has 300px wide.
+    Rows are plain (name, rgb) tuples so this can run outside the event loop.
+    """
+
+    total_data = len(rows)
     column_px = 300
     if total_data <= 15 * 1:
         boundary = 5  # max item per column
@@ -114,44 +134,68 @@ def generate_image_color_list(role_list: list[discord.Role]) -> io.BytesIO:
         boundary = 25
         row_px = 1000
 
-    background_color = Color(
-        0, 0, 0, 0
-    )  # RGBA format with alpha set to 0 for transparency
     column_need = total_data // boundary + (1 if total_data % boundary else 0)
     width, height = column_px * column_need, row_px
-    canvas = Canvas(width, height, background_color)
-
-    number = 1
-    max_role_len = 15
-    for col in range(column_need):
-        x_now = (col * column_px) + 10
-        y_now = 1
-        for role in role_list[col * boundary : (col + 1) * boundary]:
-            name = (
-                role.name[:15] + "..." if len(role.name) > max_role_len else role.name
-            )
-            text = f"{number}. {name}"
-            fill_color = Paint.Color(Color(*role.color.to_rgb()))
-
-            draw_text(
-                canvas=canvas,
-                text=text,
-                x=x_now,
-                y=y_now,
-                size=CustomRoleConfig.FONT_SIZE,
-                font=font,
-                draw_emojis=True,
-                fill=fill_color,
-            )
-
-            y_now += CustomRoleConfig.FONT_SIZE + 10
-            number += 1
+    # RGBA format with alpha set to 0 for transparency
+    image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+
+    for index, (role_name, rgb) in enumerate(rows):
+        col, row = divmod(index, boundary)
+        tile = _get_color_row_tile(index + 1, role_name, rgb)
+        image.alpha_composite(
+            tile, dest=(col * column_px, row * (CustomRoleConfig.FONT_SIZE + 10))
+        )
 
     image_bytes = io.BytesIO()
-    image = canvas.to_image()
     image.save(image_bytes, format="PNG")
 
-    return image_bytes
+    return image_bytes.getvalue()
+
+
+def _get_color_row_tile(
+    number: int, role_name: str, rgb: tuple[int, int, int]
+) -> Image.Image:
+    key = (number, role_name, rgb)
+    with _color_row_tiles_lock:
+        if (tile := _color_row_tiles.get(key)) is not None:
+            _color_row_tiles.move_to_end(key)
+            return tile
+
+    tile = _render_color_row_tile(number, role_name, rgb)
+
+    with _color_row_tiles_lock:
+        _color_row_tiles[key] = tile
+        while len(_color_row_tiles) > COLOR_ROW_TILE_CACHE_SIZE:
+            _color_row_tiles.popitem(last=False)
+
+    return tile
+
+
+def _render_color_row_tile(
+    number: int, role_name: str, rgb: tuple[int, int, int]
+) -> Image.Image:
+    """
+    Draw a single row of the color list on its own transparent tile.
+    The tile is larger than a row so long names and descenders overflow into
+    the neighbouring rows and columns the same way they did on a shared canvas.
+    """
+    max_role_len = 15
+    name = role_name[:15] + "..." if len(role_name) > max_role_len else role_name
+    text = f"{number}. {name}"
+
+    canvas = Canvas(600, 2 * (CustomRoleConfig.FONT_SIZE + 10), Color(0, 0, 0, 0))
+    draw_text(
+        canvas=canvas,
+        text=text,
+        x=10,
+        y=1,
+        size=CustomRoleConfig.FONT_SIZE,
+        font=get_color_list_font(),
+        draw_emojis=True,
+        fill=Paint.Color(Color(*rgb)),
+    )
+
+    return canvas.to_image()
 
 
 def hex_to_discord_color(hex_color: str) -> discord.Color:
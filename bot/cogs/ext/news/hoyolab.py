@@ -1,14 +1,44 @@
-from dataclasses import dataclass
-from enum import Enum
 from pathlib import Path
-from typing import TypedDict
 
 import hoyolabrssfeeds as hrf
 
 from bot.config.news import JSON_HOYOLAB_NEWS_PATH
 
 
-def hoyolab_news() -> hrf.GameFeed:
+class CachedJSONFeedFileWriter(hrf.writers.JSONFeedFileWriter):
+    """
+    JSON feed writer that also keeps the written items in memory.
+    """
+
+    def __init__(self, config: hrf.models.FeedFileWriterConfig) -> None:
+        super().__init__(config)
+        self.feed_items: list[hrf.models.FeedItem] | None = None
+
+    async def write_feed(
+        self, feed_meta: hrf.models.FeedMeta, feed_items: list[hrf.models.FeedItem]
+    ) -> None:
+        await super().write_feed(feed_meta, feed_items)
+        self.feed_items = list(feed_items)
+
+
+class CachedJSONFeedFileLoader(hrf.loaders.JSONFeedFileLoader):
+    """
+    Reads the feed file once, then serves the items last written by `writer`.
+    """
+
+    def __init__(
+        self, config: hrf.models.FeedFileConfig, writer: CachedJSONFeedFileWriter
+    ) -> None:
+        super().__init__(config)
+        self.writer = writer
+
+    async def get_feed_items(self) -> list[hrf.models.FeedItem]:
+        if self.writer.feed_items is None:
+            self.writer.feed_items = await super().get_feed_items()
+        return list(self.writer.feed_items)
+
+
+def hoyolab_news() -> tuple[hrf.GameFeed, CachedJSONFeedFileWriter]:
     genshin_meta = hrf.models.FeedMeta(
         game=hrf.models.Game.GENSHIN,
         language=hrf.models.Language.INDONESIAN,
@@ -18,41 +48,17 @@ def hoyolab_news() -> hrf.GameFeed:
         feed_type=hrf.models.FeedType.JSON,
         path=json_path,
     )
-    json_writer = hrf.writers.JSONFeedFileWriter(config=json_writer_config)
+    json_writer = CachedJSONFeedFileWriter(config=json_writer_config)
+    json_loader = CachedJSONFeedFileLoader(
+        config=hrf.models.FeedFileConfig(
+            feed_type=hrf.models.FeedType.JSON, path=json_path
+        ),
+        writer=json_writer,
+    )
 
-    return hrf.feeds.GameFeed(
+    feed = hrf.feeds.GameFeed(
         feed_meta=genshin_meta,
         feed_writers=[json_writer],
+        feed_loader=json_loader,
     )
-
-
-class Name(Enum):
-    GI_OFFICIAL_ID = "GI Official - ID"
-    HILICHURL_YANG_GIAT = "Hilichurl yang Giat"
-
-
-@dataclass
-class HoyolabNewsAuthor(TypedDict):
-    name: Name
-
-
-@dataclass
-class HoyolabNewsItem(TypedDict):
-    id: int
-    url: str
-    title: str
-    authors: list[HoyolabNewsAuthor]
-    tags: list[str]
-    content_html: str
-    date_published: str
-    summary: str
-    image: str
-
-
-@dataclass
-class HoyolabNews(TypedDict):
-    version: str
-    title: str
-    language: str
-    home_page_url: str
-    items: list[HoyolabNewsItem]
+    return feed, json_writer
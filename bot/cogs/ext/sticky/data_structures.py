@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+import discord
+
+
+@dataclass(slots=True)
+class StickyEntry:
+    channel_id: int
+    message_id: int
+    message: str
+    delay_time: int
+    handle: discord.Message | discord.PartialMessage | None = None
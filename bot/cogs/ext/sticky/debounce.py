@@ -0,0 +1,91 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# a busy channel still gets its repost this many `delay`s after the first message
+MAX_WAIT_FACTOR = 5
+
+
+class RepostScheduler:
+    """
+    Debounce sticky reposts per channel.
+    Every new message restarts the channel timer, so a burst of messages
+    collapses into a single repost once the channel has been quiet for `delay`.
+    A channel that never goes quiet still gets its repost `MAX_WAIT_FACTOR` times
+    `delay` after the first absorbed message.
+    """
+
+    def __init__(self) -> None:
+        self._timers: dict[int, asyncio.Task] = {}
+        self._locks: dict[int, asyncio.Lock] = {}
+        # {channel_id: loop time} of the first message absorbed by the pending repost
+        self._first_seen: dict[int, float] = {}
+        self.absorbed_count = 0
+        self.repost_count = 0
+
+    def schedule(
+        self,
+        channel_id: int,
+        delay: float,
+        callback: Callable[[], Awaitable[None]],
+    ) -> None:
+        now = asyncio.get_running_loop().time()
+        timer = self._timers.get(channel_id)
+        if timer and not timer.done():
+            timer.cancel()
+            self.absorbed_count += 1
+        else:
+            self._first_seen[channel_id] = now
+
+        max_wait = delay * MAX_WAIT_FACTOR
+        wait = min(delay, max(0.0, self._first_seen[channel_id] + max_wait - now))
+        self._timers[channel_id] = asyncio.create_task(
+            self._run(channel_id, wait, callback)
+        )
+
+    def cancel(self, channel_id: int) -> None:
+        if timer := self._timers.pop(channel_id, None):
+            timer.cancel()
+        self._first_seen.pop(channel_id, None)
+        self._prune_lock(channel_id)
+
+    def cancel_all(self) -> None:
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        self._first_seen.clear()
+        for channel_id in list(self._locks):
+            self._prune_lock(channel_id)
+
+    def _prune_lock(self, channel_id: int) -> None:
+        # a running repost keeps its lock so a new one cannot overlap it
+        lock = self._locks.get(channel_id)
+        if lock and not lock.locked():
+            del self._locks[channel_id]
+
+    async def _run(
+        self,
+        channel_id: int,
+        delay: float,
+        callback: Callable[[], Awaitable[None]],
+    ) -> None:
+        await asyncio.sleep(delay)
+
+        # Once the channel is quiet the repost must not be cancelled by a newer
+        # message, that message will start its own timer instead.
+        self._timers.pop(channel_id, None)
+        self._first_seen.pop(channel_id, None)
+        lock = self._locks.setdefault(channel_id, asyncio.Lock())
+        async with lock:
+            try:
+                await callback()
+            except Exception:
+                logger.exception(
+                    "Failed to repost sticky message",
+                    extra={"channel_id": channel_id},
+                )
+                return
+
+        self.repost_count += 1
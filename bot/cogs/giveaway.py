@@ -3,13 +3,17 @@ from datetime import UTC, datetime, timedelta
 
 import discord
 from discord import Interaction, app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 from bot.bot import WarnetBot
 from bot.config import BLACKLIST_GA_ROLE_ID, GUILD_ID
+from bot.helper import gather_bounded
 
 logger = logging.getLogger(__name__)
 
+BLACKLIST_GA_TIMER_EVENT = "blacklist_ga"
+BLACKLIST_GA_RETRY_DELAY = 60
+
 
 @commands.guild_only()
 class Giveaway(commands.GroupCog, group_name="warnet-ga"):
@@ -17,10 +21,11 @@ class Giveaway(commands.GroupCog, group_name="warnet-ga"):
         self.bot = bot
         self.db_pool = bot.get_db_pool()
 
-    @commands.Cog.listener()
-    async def on_connect(self) -> None:
-        if not self._check_blacklist_ga.is_running():
-            self._check_blacklist_ga.start()
+    async def cog_load(self) -> None:
+        self.bot.timers.register(BLACKLIST_GA_TIMER_EVENT, self._check_blacklist_ga)
+
+    async def cog_unload(self) -> None:
+        self.bot.timers.unregister(BLACKLIST_GA_TIMER_EVENT)
 
     async def cog_command_error(self, ctx: commands.Context, error: Exception) -> None:
         logger.exception("An unexpected error occurred in Admin cog", exc_info=error)
@@ -38,7 +43,7 @@ class Giveaway(commands.GroupCog, group_name="warnet-ga"):
         winners="Discord IDs of the giveaway winner. Example: 1234567890,0987654321",
         ghosts="Member IDs who do not claim the giveaway. Example: 1234567890,0987654321",
     )
-    async def add_giveaway_blacklist(  # noqa: C901, PLR0912, FIX002 # TODO: Improve this function
+    async def add_giveaway_blacklist(  # noqa: C901, PLR0912, PLR0915, FIX002 # TODO: Improve this function
         self,
         interaction: Interaction,
         big: bool,
@@ -92,66 +97,58 @@ class Giveaway(commands.GroupCog, group_name="warnet-ga"):
             )
             return None
 
+        user_ids = [member.id for member in winner_list + ghost_list]
         async with self.db_pool.acquire() as conn:
-            streak_user_records = await conn.fetch(
-                "SELECT user_id FROM blacklist_ga WHERE status_user = 1",
+            existing_records = await conn.fetch(
+                "SELECT user_id, status_user, cooldown_time FROM blacklist_ga WHERE user_id = ANY($1::bigint[])",
+                user_ids,
             )
-            streak_user = {record["user_id"] for record in streak_user_records}
-
-            for winner in winner_list:
-                await winner.add_roles(blacklist_role)
-                if winner.id in streak_user:
-                    await conn.execute(
-                        """
-                        UPDATE blacklist_ga
-                        SET end_time = $2, status_user = $3, cooldown_time = $4
-                        WHERE user_id = $1
-                        """,
-                        winner.id,
-                        end_time_streak,
-                        0,
-                        end_time_streak,
-                    )
-                else:
-                    await conn.execute(
-                        "INSERT INTO blacklist_ga (user_id, end_time, status_user, cooldown_time) VALUES ($1, $2, $3, $4)",
-                        winner.id,
-                        end_time_no_streak,
-                        1,
-                        end_time_streak,
-                    )
-                logger.info(
-                    "Added role blacklist role to winner",
-                    extra={
-                        "role_id": blacklist_role.id,
-                        "winner_id": winner.id,
-                        "winned_day": winner_day,
-                    },
-                )
+        existing = {record["user_id"]: record for record in existing_records}
+        streak_user = {
+            user_id
+            for user_id, record in existing.items()
+            if record["status_user"] == 1
+        }
 
-            for ghost in ghost_list:
-                await ghost.add_roles(blacklist_role)
-                if ghost.id in streak_user:
-                    await conn.execute(
-                        "UPDATE blacklist_ga SET end_time = $2 WHERE user_id = $1",
-                        ghost.id,
-                        end_time_ghosting,
-                    )
-                else:
-                    await conn.execute(
-                        "INSERT INTO blacklist_ga (user_id, end_time, status_user) VALUES ($1, $2, $3)",
-                        ghost.id,
-                        end_time_ghosting,
-                        0,
-                    )
-                logger.info(
-                    "Added role blacklist role to ghost",
-                    extra={
-                        "role_id": blacklist_role.id,
-                        "winner_id": ghost.id,
-                        "winned_day": winner_day,
-                    },
+        # user_id -> (end_time, status_user, cooldown_time), ghosts override winners
+        rows: dict[int, tuple[datetime, int, datetime | None]] = {}
+        for winner in winner_list:
+            if winner.id in streak_user:
+                rows[winner.id] = (end_time_streak, 0, end_time_streak)
+            else:
+                rows[winner.id] = (end_time_no_streak, 1, end_time_streak)
+
+        for ghost in ghost_list:
+            if ghost.id in streak_user:
+                record = existing[ghost.id]
+                rows[ghost.id] = (
+                    end_time_ghosting,
+                    record["status_user"],
+                    record["cooldown_time"],
                 )
+            else:
+                rows[ghost.id] = (end_time_ghosting, 0, None)
+
+        await self._upsert_blacklist_ga(rows)
+        await self._grant_blacklist_role(winner_list + ghost_list, blacklist_role)
+        logger.info(
+            "Added blacklist role to giveaway winners and ghosts",
+            extra={
+                "role_id": blacklist_role.id,
+                "winner_ids": [winner.id for winner in winner_list],
+                "ghost_ids": [ghost.id for ghost in ghost_list],
+                "winned_day": winner_day,
+            },
+        )
+
+        # the handler reschedules itself for the later role removals and cleanups
+        timer_times = set()
+        if winner_list:
+            timer_times.update((end_time_no_streak, end_time_streak))
+        if ghost_list:
+            timer_times.add(end_time_ghosting)
+        if timer_times:
+            self.bot.timers.schedule(BLACKLIST_GA_TIMER_EVENT, min(timer_times))
 
         embed = discord.Embed(
             title="Role Added",
@@ -168,52 +165,122 @@ class Giveaway(commands.GroupCog, group_name="warnet-ga"):
         )
         return await interaction.followup.send(embed=embed)
 
-    @tasks.loop(seconds=60)
-    async def _check_blacklist_ga(self) -> None:
+    async def _upsert_blacklist_ga(
+        self, rows: dict[int, tuple[datetime, int, datetime | None]]
+    ) -> None:
+        async with self.db_pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO blacklist_ga (user_id, end_time, status_user, cooldown_time, has_role)
+                SELECT user_id, end_time, status_user, cooldown_time, TRUE
+                FROM unnest($1::bigint[], $2::timestamptz[], $3::int[], $4::timestamptz[])
+                    AS t(user_id, end_time, status_user, cooldown_time)
+                ON CONFLICT (user_id) DO UPDATE
+                SET end_time = EXCLUDED.end_time,
+                    status_user = EXCLUDED.status_user,
+                    cooldown_time = EXCLUDED.cooldown_time,
+                    has_role = TRUE
+                """,
+                list(rows),
+                [row[0] for row in rows.values()],
+                [row[1] for row in rows.values()],
+                [row[2] for row in rows.values()],
+            )
+
+    @staticmethod
+    async def _grant_blacklist_role(
+        member_list: list[discord.Member], blacklist_role: discord.Role
+    ) -> None:
+        members = {member.id: member for member in member_list}
+        results = await gather_bounded(
+            members.values(), lambda member: member.add_roles(blacklist_role)
+        )
+        for member, error in results:
+            if error is not None:
+                logger.error(
+                    "Failed to add blacklist role",
+                    extra={"role_id": blacklist_role.id, "user_id": member.id},
+                    exc_info=error,
+                )
+
+    async def _check_blacklist_ga(self, now: datetime) -> datetime | None:
+        retry_time = now + timedelta(seconds=BLACKLIST_GA_RETRY_DELAY)
         guild = self.bot.get_guild(GUILD_ID)
         if guild is None:
             logger.error("Guild not found")
-            return
+            return retry_time
 
         blacklist_role = guild.get_role(BLACKLIST_GA_ROLE_ID)
         if blacklist_role is None:
             logger.error("Blacklist role not found")
-            return
-
-        now = datetime.now(UTC)
+            return retry_time
 
         async with self.db_pool.acquire() as conn:
-            user_want_remove = await conn.fetch(
-                "SELECT user_id FROM blacklist_ga WHERE end_time <= $1 AND has_role = TRUE",
+            expired_records = await conn.fetch(
+                """
+                UPDATE blacklist_ga SET has_role = FALSE
+                WHERE has_role AND end_time <= $1
+                RETURNING user_id
+                """,
                 now,
             )
-            for user in user_want_remove:
-                if user := guild.get_member(int(user["user_id"])):
-                    await user.remove_roles(blacklist_role)
-                    await conn.execute(
-                        "UPDATE blacklist_ga SET has_role = FALSE WHERE user_id = $1",
-                        user.id,
-                    )
-                    logger.info(
-                        "Removed role  from user (rm role)",
-                        extra={"role": blacklist_role.id, "user": user.id},
-                    )
 
-            user_want_delete = await conn.fetch(
-                "SELECT user_id FROM blacklist_ga WHERE has_role = FALSE AND status_user = 0 OR cooldown_time <= $1",
+        # members who left the guild already lost the role
+        members = [
+            member
+            for record in expired_records
+            if (member := guild.get_member(record["user_id"]))
+        ]
+        results = await gather_bounded(
+            members, lambda member: member.remove_roles(blacklist_role)
+        )
+        failed_ids = []
+        for member, error in results:
+            if error is None:
+                continue
+            failed_ids.append(member.id)
+            logger.error(
+                "Failed to remove blacklist role",
+                extra={"role": blacklist_role.id, "user": member.id},
+                exc_info=error,
+            )
+
+        async with self.db_pool.acquire() as conn:
+            if failed_ids:
+                await conn.execute(
+                    "UPDATE blacklist_ga SET has_role = TRUE WHERE user_id = ANY($1::bigint[])",
+                    failed_ids,
+                )
+            deleted_records = await conn.fetch(
+                """
+                DELETE FROM blacklist_ga
+                WHERE NOT has_role AND (status_user = 0 OR cooldown_time <= $1)
+                RETURNING user_id
+                """,
                 now,
             )
-            for user in user_want_delete:
-                if user:
-                    await conn.execute(
-                        "DELETE FROM blacklist_ga WHERE user_id = $1",
-                        int(user["user_id"]),
-                    )
-                    logger.info("Deleted user (rm row table)", extra=user)
+            next_deadline = await conn.fetchval(
+                """
+                SELECT LEAST(
+                    (SELECT MIN(end_time) FROM blacklist_ga WHERE has_role AND end_time > $1),
+                    (SELECT MIN(cooldown_time) FROM blacklist_ga WHERE cooldown_time > $1)
+                )
+                """,
+                now,
+            )
+
+        logger.info(
+            "Expired giveaway blacklist",
+            extra={
+                "role": blacklist_role.id,
+                "removed_role_count": len(members) - len(failed_ids),
+                "deleted_row_count": len(deleted_records),
+            },
+        )
 
-    @_check_blacklist_ga.before_loop
-    async def _before_check_blacklist_ga(self) -> None:
-        await self.bot.wait_until_ready()
+        if failed_ids:
+            return min(retry_time, next_deadline or retry_time)
+        return next_deadline
 
 
 async def setup(bot: WarnetBot) -> None:
@@ -1,15 +1,15 @@
 import asyncio
 import datetime
-import json
 import logging
 from pathlib import Path
 
 import discord
+import hoyolabrssfeeds as hrf
 from anyio import open_file
 from discord.ext import commands, tasks
 
 from bot.bot import WarnetBot
-from bot.cogs.ext.news.hoyolab import HoyolabNews, hoyolab_news
+from bot.cogs.ext.news.hoyolab import hoyolab_news
 from bot.config import news as news_config
 
 logger = logging.getLogger(__name__)
@@ -19,6 +19,8 @@ logger = logging.getLogger(__name__)
 class News(commands.GroupCog):
     def __init__(self, bot: WarnetBot) -> None:
         self.bot = bot
+        self.news, self.news_writer = hoyolab_news()
+        self.seen_news_ids: set[int] | None = None
 
     @commands.Cog.listener()
     async def on_connect(self) -> None:
@@ -33,7 +35,6 @@ class News(commands.GroupCog):
 
     @tasks.loop(time=news_config.TIMES_CHECK_UPDATE)
     async def _news_hoyolab(self) -> None:
-        news = hoyolab_news()
         info_channel = self.bot.get_channel(news_config.INFORMATION_CHANNEL_ID)
         if info_channel is None:
             logger.error(
@@ -42,33 +43,21 @@ class News(commands.GroupCog):
             )
             return
 
-        async with await open_file(
-            news_config.LAST_ID_HOYOLAB_NEWS_PATH, encoding="utf-8"
-        ) as f:
-            contents = await f.read()
-            last_id = contents.strip()
-
-        await news.create_feed()
+        await self.news.create_feed(session=self.bot.session)
+        feed_items = self.news_writer.feed_items or []
 
-        if not news.was_updated and last_id != "":
+        if self.seen_news_ids is None:
+            self.seen_news_ids = await self._load_seen_news_ids(feed_items)
+        elif not self.news.was_updated:
             return
 
-        async with await open_file(
-            news_config.JSON_HOYOLAB_NEWS_PATH, encoding="utf-8"
-        ) as f:
-            contents = await f.read()
-            news_json: HoyolabNews = json.loads(contents)
-            news_data = news_json["items"]
-
-        start_index = None
-        for i, item in enumerate(news_data):
-            if item["id"] == last_id:
-                start_index = i
-                break
-
-        new_news = news_data if start_index is None else news_data[:start_index]
+        # feed items are sorted by id with the latest at the top
+        new_news = [item for item in feed_items if item.id not in self.seen_news_ids]
+        if not new_news:
+            return
 
-        for item in reversed(new_news):
+        for feed_item in reversed(new_news):
+            item = self.news_writer.create_json_feed_item(feed_item)
             embed = discord.Embed(
                 title=item["title"],
                 url=item["url"],
@@ -77,7 +66,7 @@ class News(commands.GroupCog):
                 ),
                 timestamp=datetime.datetime.fromisoformat(item["date_published"]),
             )
-            embed.set_image(url=item["image"])
+            embed.set_image(url=item.get("image"))
             embed.set_author(
                 name=f"Hoyolab - {item['tags'][0]}",
                 icon_url="https://www.hoyolab.com/favicon.ico",
@@ -86,14 +75,35 @@ class News(commands.GroupCog):
 
             await asyncio.sleep(1)
 
+        self.seen_news_ids.update(item.id for item in new_news)
         async with await open_file(
-            news_config.LAST_ID_HOYOLAB_NEWS_PATH, "w", encoding="utf-8"
+            news_config.LAST_ID_HOYOLAB_NEWS_PATH, "a", encoding="utf-8"
         ) as f:
-            await f.write(str(news_data[0]["id"]))
+            # leading newline because older files hold a single id without one
+            await f.write("".join(f"\n{item.id}" for item in new_news))
 
         logger.info("[hoyolab] Successfully sent news updates to the channel.")
         return
 
+    @staticmethod
+    async def _load_seen_news_ids(
+        feed_items: list[hrf.models.FeedItem],
+    ) -> set[int]:
+        """
+        Read the posted news ids, one per line. Older versions only stored the
+        latest id, so every feed item up to the highest stored id counts as seen.
+        """
+        async with await open_file(
+            news_config.LAST_ID_HOYOLAB_NEWS_PATH, encoding="utf-8"
+        ) as f:
+            contents = await f.read()
+
+        seen_news_ids = {int(line) for line in contents.split()}
+        if seen_news_ids:
+            last_id = max(seen_news_ids)
+            seen_news_ids.update(item.id for item in feed_items if item.id <= last_id)
+        return seen_news_ids
+
     @_news_hoyolab.before_loop
     async def _before_news_hoyolab(self) -> None:
         await self.bot.wait_until_ready()
@@ -1,12 +1,16 @@
 import asyncio
+import contextlib
 import logging
 from datetime import UTC, datetime
+from functools import partial
 
 import discord
 from discord import Interaction, app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
 
 from bot.bot import WarnetBot
+from bot.cogs.ext.sticky.data_structures import StickyEntry
+from bot.cogs.ext.sticky.debounce import RepostScheduler
 from bot.cogs.views.sticky import StickyPagination
 from bot.helper import app_guard
 
@@ -18,57 +22,94 @@ class Sticky(commands.GroupCog, group_name="sticky"):
     def __init__(self, bot: WarnetBot) -> None:
         self.bot = bot
         self.db_pool = bot.get_db_pool()
-        self.sticky_data: dict[int, list] = {}
+        self.sticky_data: dict[int, StickyEntry] = {}
+        self.repost_scheduler = RepostScheduler()
+        # {channel_id: message_id} waiting to be written to the database
+        self.pending_message_ids: dict[int, int] = {}
 
-    @commands.Cog.listener()
-    async def on_connect(self) -> None:
+    async def cog_load(self) -> None:
         async with self.db_pool.acquire() as conn:
-            records = await conn.fetch("SELECT * FROM sticky ORDER BY channel_id ASC;")
-            data_list = [dict(row) for row in records]
-            for data in data_list:
-                self.sticky_data[data["channel_id"]] = [
-                    data["message_id"],
-                    data["message"],
-                    data["delay_time"],
-                ]
+            records = await conn.fetch("SELECT * FROM sticky;")
+
+        for record in records:
+            self.sticky_data[record["channel_id"]] = StickyEntry(
+                channel_id=record["channel_id"],
+                message_id=record["message_id"],
+                message=record["message"],
+                delay_time=record["delay_time"],
+            )
+
+        if not self._flush_message_ids.is_running():
+            self._flush_message_ids.start()
+
+    async def cog_unload(self) -> None:
+        self.repost_scheduler.cancel_all()
+        self._flush_message_ids.cancel()
+        await self._write_pending_message_ids()
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        res = None
-        if message.channel.id in self.sticky_data:
-            res = self.sticky_data[message.channel.id]
-
-        if res and message.author != self.bot.user:
-            sticky_message_id = res[0]
-            sticky_message = res[1]
-            delay_time = res[2]
-            try:
-                sticky = await message.channel.fetch_message(sticky_message_id)
-            except discord.errors.NotFound:
-                return
+        if message.author == self.bot.user:
+            return
 
+        entry = self.sticky_data.get(message.channel.id)
+        if entry is None:
+            return
+
+        self.repost_scheduler.schedule(
+            message.channel.id,
+            entry.delay_time,
+            partial(self._repost_sticky_message, message.channel),
+        )
+
+    async def _repost_sticky_message(self, channel: discord.abc.Messageable) -> None:
+        # sticky may have been removed while the channel timer was running
+        entry = self.sticky_data.get(channel.id)
+        if entry is None:
+            return
+
+        sticky = entry.handle or channel.get_partial_message(entry.message_id)
+        try:
             await sticky.delete()
-            await asyncio.sleep(delay_time)
-            msg = await message.channel.send(sticky_message)
+        except discord.errors.NotFound:
+            return
+
+        msg = await channel.send(entry.message)
+        entry.message_id = msg.id
+        entry.handle = msg
+        self.pending_message_ids[channel.id] = msg.id
+
+    @tasks.loop(seconds=5)
+    async def _flush_message_ids(self) -> None:
+        await self._write_pending_message_ids()
+
+    async def _write_pending_message_ids(self) -> None:
+        if not self.pending_message_ids:
+            return
 
+        pending = self.pending_message_ids
+        self.pending_message_ids = {}
+        try:
             async with self.db_pool.acquire() as conn:
-                await conn.execute(
+                await conn.executemany(
                     "UPDATE sticky SET message_id=$2 WHERE channel_id=$1;",
-                    message.channel.id,
-                    msg.id,
+                    list(pending.items()),
                 )
-
-            self.sticky_data[message.channel.id] = [msg.id, sticky_message, delay_time]
+        except Exception:
+            logger.exception(
+                "Failed to write sticky message ids", extra={"count": len(pending)}
+            )
+            # keep newer ids recorded while the write was in flight
+            for channel_id, message_id in pending.items():
+                self.pending_message_ids.setdefault(channel_id, message_id)
 
     @app_commands.command(name="list", description="List channel with sticky message.")
     async def list_sticky_messages(self, interaction: Interaction) -> None:
         await interaction.response.defer()
-        async with self.db_pool.acquire() as conn:
-            res = await conn.fetch("SELECT * FROM sticky ORDER BY channel_id ASC;")
-            record = [dict(row) for row in res]
-
-            view = StickyPagination(list_data=record)
-            await view.start(interaction)
+        view = StickyPagination(
+            list_data=[self.sticky_data[key] for key in sorted(self.sticky_data)]
+        )
+        await view.start(interaction)
 
     @app_commands.command(name="add", description="Add sticky message to a channel.")
     @app_commands.describe(
@@ -90,18 +131,13 @@ class Sticky(commands.GroupCog, group_name="sticky"):
         if interaction.guild is None:
             return None
 
-        async with self.db_pool.acquire() as conn:
-            res = await conn.fetchrow(
-                "SELECT channel_id FROM sticky WHERE channel_id=$1;", channel.id
-            )
-
         target = interaction.guild.get_channel_or_thread(channel.id)
         if target is None:
             logger.error("Channel not found", extra={"channel_id": channel.id})
             return None
 
         instance_name = "thread" if isinstance(target, discord.Thread) else "channel"
-        if res:
+        if channel.id in self.sticky_data:
             return await self._send_interaction(
                 interaction,
                 color=discord.Color.red(),
@@ -123,7 +159,13 @@ class Sticky(commands.GroupCog, group_name="sticky"):
                 delay_time,
             )
 
-        self.sticky_data[channel.id] = [msg.id, message, delay_time]
+        self.sticky_data[channel.id] = StickyEntry(
+            channel_id=channel.id,
+            message_id=msg.id,
+            message=message,
+            delay_time=delay_time,
+            handle=msg,
+        )
         logger.info(
             "NEW STICKY MESSSAGE HAS BEEN ADDED",
             extra={
@@ -164,19 +206,13 @@ class Sticky(commands.GroupCog, group_name="sticky"):
         if interaction.guild is None:
             return None
 
-        async with self.db_pool.acquire() as conn:
-            data = await conn.fetchrow(
-                "SELECT channel_id,message_id,delay_time FROM sticky WHERE channel_id=$1;",
-                channel.id,
-            )
-
         target = interaction.guild.get_channel_or_thread(channel.id)
         if target is None:
             logger.error("Channel not found", extra={"channel_id": channel.id})
             return None
 
         instance_name = "thread" if isinstance(target, discord.Thread) else "channel"
-        if not data:
+        if (entry := self.sticky_data.get(channel.id)) is None:
             return await self._send_interaction(
                 interaction,
                 color=discord.Color.red(),
@@ -185,15 +221,16 @@ class Sticky(commands.GroupCog, group_name="sticky"):
             )
 
         if not delay_time:
-            delay_time = data["delay_time"]
+            delay_time = entry.delay_time
 
         try:
-            sticky_msg = await channel.fetch_message(data["message_id"])
+            sticky_msg = entry.handle or channel.get_partial_message(entry.message_id)
             message = "\n".join(message.split("\\n"))
             sticky_data = await sticky_msg.edit(content=message)
         except discord.errors.NotFound:
             message = "\n".join(message.split("\\n"))
             sticky_data = await target.send(message)
+            self.pending_message_ids[channel.id] = sticky_data.id
 
         async with self.db_pool.acquire() as conn:
             await conn.execute(
@@ -203,7 +240,10 @@ class Sticky(commands.GroupCog, group_name="sticky"):
                 delay_time,
             )
 
-        self.sticky_data[channel.id] = [sticky_data.id, message, delay_time]
+        entry.message_id = sticky_data.id
+        entry.message = message
+        entry.delay_time = delay_time
+        entry.handle = sticky_data
 
         return await self._send_interaction(
             interaction,
@@ -233,19 +273,13 @@ class Sticky(commands.GroupCog, group_name="sticky"):
         if interaction.guild is None:
             return None
 
-        async with self.db_pool.acquire() as conn:
-            data = await conn.fetchrow(
-                "SELECT channel_id,message_id FROM sticky WHERE channel_id=$1;",
-                channel.id,
-            )
-
         target = interaction.guild.get_channel_or_thread(channel.id)
         if target is None:
             logger.error("Channel not found", extra={"channel_id": channel.id})
             return None
 
         instance_name = "thread" if isinstance(target, discord.Thread) else "channel"
-        if not data:
+        if (entry := self.sticky_data.get(channel.id)) is None:
             return await self._send_interaction(
                 interaction,
                 color=discord.Color.red(),
@@ -253,16 +287,16 @@ class Sticky(commands.GroupCog, group_name="sticky"):
                 description=f"Tidak ada sticky message pada {instance_name} {channel.mention}",
             )
 
-        try:
-            sticky = await channel.fetch_message(data["message_id"])
+        with contextlib.suppress(discord.errors.NotFound):
+            sticky = entry.handle or channel.get_partial_message(entry.message_id)
             await sticky.delete()
-        except discord.errors.NotFound:
-            pass
 
         async with self.db_pool.acquire() as conn:
             await conn.execute("DELETE FROM sticky WHERE channel_id=$1;", channel.id)
 
         self.sticky_data.pop(channel.id)
+        self.pending_message_ids.pop(channel.id, None)
+        self.repost_scheduler.cancel(channel.id)
         logger.info(
             "NEW STICKY MESSSAGE HAS BEEN REMOVED", extra={"channel_id": channel.id}
         )
@@ -290,19 +324,13 @@ class Sticky(commands.GroupCog, group_name="sticky"):
         if interaction.guild is None:
             return None
 
-        async with self.db_pool.acquire() as conn:
-            data = await conn.fetchrow(
-                "SELECT * FROM sticky WHERE channel_id=$1;",
-                channel.id,
-            )
-
         target = interaction.guild.get_channel_or_thread(channel.id)
         if target is None:
             logger.error("Channel not found", extra={"channel_id": channel.id})
             return None
 
         instance_name = "thread" if isinstance(target, discord.Thread) else "channel"
-        if not data:
+        if (entry := self.sticky_data.get(channel.id)) is None:
             return await self._send_interaction(
                 interaction,
                 color=discord.Color.red(),
@@ -311,7 +339,7 @@ class Sticky(commands.GroupCog, group_name="sticky"):
             )
 
         try:
-            await channel.fetch_message(data["message_id"])
+            await channel.fetch_message(entry.message_id)
             return await self._send_interaction(
                 interaction,
                 color=discord.Color.red(),
@@ -319,8 +347,9 @@ class Sticky(commands.GroupCog, group_name="sticky"):
                 description=f"Sticky message telah terpasang pada {instance_name} {channel.mention}",
             )
         except discord.errors.NotFound:
-            msg = await target.send(data["message"])
+            msg = await target.send(entry.message)
 
+            self.pending_message_ids.pop(channel.id, None)
             async with self.db_pool.acquire() as conn:
                 await conn.execute(
                     "UPDATE sticky SET message_id=$2 WHERE channel_id=$1;",
@@ -328,11 +357,8 @@ class Sticky(commands.GroupCog, group_name="sticky"):
                     msg.id,
                 )
 
-            self.sticky_data[channel.id] = [
-                msg.id,
-                data["message"],
-                data["delay_time"],
-            ]
+            entry.message_id = msg.id
+            entry.handle = msg
 
             return await self._send_interaction(
                 interaction,
@@ -360,36 +386,36 @@ class Sticky(commands.GroupCog, group_name="sticky"):
         if interaction.guild is None:
             return None
 
-        async with self.db_pool.acquire() as conn:
-            res = await conn.fetch("SELECT * FROM sticky;")
-            data = [dict(row) for row in res]
-            invalid_channel_id_list = []
-            for sticky in data:
-                try:
-                    channel = interaction.guild.get_channel_or_thread(
-                        sticky["channel_id"]
-                    )
-                    if channel is None:
-                        logger.error(
-                            "Channel not found",
-                            extra={"channel_id": sticky["channel_id"]},
-                        )
-                        return None
-                    message = await channel.fetch_message(sticky["message_id"])
-                    if not invalid_channel_only:
-                        await message.delete()
-                except AttributeError:  # This is happened if channel is None
-                    invalid_channel_id_list.append([sticky["channel_id"]])
-                except discord.errors.NotFound:
-                    continue
-
-            if not invalid_channel_only:
-                await conn.execute("TRUNCATE TABLE sticky;")
-            else:
-                await conn.executemany(
-                    "DELETE FROM sticky WHERE channel_id=$1;",
-                    invalid_channel_id_list,
+        if invalid_channel_only:
+            purged_entries = [
+                entry
+                for entry in self.sticky_data.values()
+                if interaction.guild.get_channel_or_thread(entry.channel_id) is None
+            ]
+        else:
+            purged_entries = list(self.sticky_data.values())
+
+        for entry in purged_entries:
+            self.sticky_data.pop(entry.channel_id)
+            self.pending_message_ids.pop(entry.channel_id, None)
+            self.repost_scheduler.cancel(entry.channel_id)
+
+        if not invalid_channel_only:
+            # discord.py already waits on each channel's own route bucket,
+            # the semaphore only bounds how many requests are in flight
+            semaphore = asyncio.Semaphore(5)
+            await asyncio.gather(
+                *(
+                    self._delete_sticky_message(interaction.guild, entry, semaphore)
+                    for entry in purged_entries
                 )
+            )
+
+        async with self.db_pool.acquire() as conn:
+            await conn.execute(
+                "DELETE FROM sticky WHERE channel_id = ANY($1::bigint[]);",
+                [entry.channel_id for entry in purged_entries],
+            )
 
         logger.info("STICKY MESSSAGES HAVE BEEN PURGED")
         return await self._send_interaction(
@@ -402,6 +428,26 @@ class Sticky(commands.GroupCog, group_name="sticky"):
             ),
         )
 
+    @staticmethod
+    async def _delete_sticky_message(
+        guild: discord.Guild, entry: StickyEntry, semaphore: asyncio.Semaphore
+    ) -> None:
+        channel = guild.get_channel_or_thread(entry.channel_id)
+        if channel is None:
+            return
+
+        sticky = entry.handle or channel.get_partial_message(entry.message_id)
+        async with semaphore:
+            try:
+                await sticky.delete()
+            except discord.errors.NotFound:
+                pass
+            except discord.HTTPException:
+                logger.exception(
+                    "Failed to delete sticky message",
+                    extra={"channel_id": entry.channel_id},
+                )
+
     @staticmethod
     async def _send_interaction(
         interaction: Interaction, color: discord.Color, title: str, description: str
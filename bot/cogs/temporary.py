@@ -3,14 +3,18 @@ from datetime import UTC, datetime, timedelta
 
 import discord
 from discord import Interaction, app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 from bot.bot import WarnetBot
 from bot.cogs.ext.temprole.time import parse_time_string
 from bot.config import BLACKLIST_GA_ROLE_ID, GUILD_ID
+from bot.helper import gather_bounded
 
 logger = logging.getLogger(__name__)
 
+TEMPROLE_TIMER_EVENT = "temprole"
+TEMPROLE_RETRY_DELAY = 60
+
 
 @commands.guild_only()
 class Temporary(commands.GroupCog, group_name="warnet-temp"):
@@ -18,10 +22,11 @@ class Temporary(commands.GroupCog, group_name="warnet-temp"):
         self.bot = bot
         self.db_pool = bot.get_db_pool()
 
-    @commands.Cog.listener()
-    async def on_connect(self) -> None:
-        if not self._check_temprole.is_running():
-            self._check_temprole.start()
+    async def cog_load(self) -> None:
+        self.bot.timers.register(TEMPROLE_TIMER_EVENT, self._remove_expired_temproles)
+
+    async def cog_unload(self) -> None:
+        self.bot.timers.unregister(TEMPROLE_TIMER_EVENT)
 
     async def cog_command_error(self, ctx: commands.Context, error: Exception) -> None:
         logger.exception("An unexpected error occurred in Admin cog", exc_info=error)
@@ -94,6 +99,8 @@ class Temporary(commands.GroupCog, group_name="warnet-temp"):
             """
             await conn.execute(query, user.id, role.id, total_duration)
 
+        self.bot.timers.schedule(TEMPROLE_TIMER_EVENT, total_duration)
+
         embed = discord.Embed(
             title="Role Added",
             description=f"Successfully added the role {role.mention} to the {user.mention}\nremove <t:{int(total_duration.timestamp())}:R>",
@@ -101,13 +108,14 @@ class Temporary(commands.GroupCog, group_name="warnet-temp"):
         )
         return await interaction.followup.send(embed=embed)
 
-    @tasks.loop(seconds=60)
-    async def _check_temprole(self) -> None:
-        current_time = datetime.now(UTC)
+    async def _remove_expired_temproles(
+        self, current_time: datetime
+    ) -> datetime | None:
+        retry_time = current_time + timedelta(seconds=TEMPROLE_RETRY_DELAY)
         guild = self.bot.get_guild(GUILD_ID)
         if not guild:
             logger.warning("Guild not found, skipping temporary role check")
-            return
+            return retry_time
         id_success = []
 
         async with self.db_pool.acquire() as conn:
@@ -115,44 +123,54 @@ class Temporary(commands.GroupCog, group_name="warnet-temp"):
                 "SELECT id, user_id, role_id FROM temp_role WHERE end_time <= $1",
                 current_time,
             )
+            next_end_time = await conn.fetchval(
+                "SELECT MIN(end_time) FROM temp_role WHERE end_time > $1",
+                current_time,
+            )
 
         if not records:
-            return
+            return next_end_time
 
+        expired: list[tuple[discord.Member, discord.Role, int]] = []
         for record in records:
             user = guild.get_member(record["user_id"])
             role = guild.get_role(record["role_id"])
 
-            if not user:
+            # the member left or the role was deleted, nothing left to remove
+            if not user or not role or user.get_role(role.id) is None:
+                id_success.append(record["id"])
                 continue
 
-            if not role:
-                continue
+            expired.append((user, role, record["id"]))
 
-            if user.get_role(role.id) is None or not role:
-                id_success.append(record["id"])
+        results = await gather_bounded(
+            expired, lambda item: item[0].remove_roles(item[1])
+        )
+        failed = False
+        for (user, role, temp_role_id), error in results:
+            if error is None:
+                id_success.append(temp_role_id)
                 continue
 
-            try:
-                await user.remove_roles(role)
-                id_success.append(record["id"])
-            except discord.HTTPException:
-                logger.exception(
-                    "Failed to remove temporary role",
-                    extra={"user": user.id, "role": role.id},
-                )
+            failed = True
+            logger.error(
+                "Failed to remove temporary role",
+                extra={"user": user.id, "role": role.id},
+                exc_info=error,
+            )
 
-        async with self.db_pool.acquire() as conn:
-            for ids in id_success:
+        if id_success:
+            async with self.db_pool.acquire() as conn:
                 await conn.execute(
-                    "DELETE FROM temp_role WHERE id = $1",
-                    ids,
+                    "DELETE FROM temp_role WHERE id = ANY($1::int[])",
+                    id_success,
                 )
             logger.info("Removed temporary roles", extra={"count": len(id_success)})
 
-    @_check_temprole.before_loop
-    async def _before_check_temprole(self) -> None:
-        await self.bot.wait_until_ready()
+        # the next sweep picks up every expired row that is still left
+        if failed:
+            return min(retry_time, next_end_time or retry_time)
+        return next_end_time
 
 
 async def setup(bot: WarnetBot) -> None:
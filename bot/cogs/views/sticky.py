@@ -1,10 +1,11 @@
 from datetime import UTC, datetime
-from typing import Any
 
 import discord
 from discord import Interaction
 from discord.ext import commands
 
+from bot.cogs.ext.sticky.data_structures import StickyEntry
+
 
 class StickyPagination(discord.ui.View):
     def __init__(
@@ -16,7 +17,7 @@ class StickyPagination(discord.ui.View):
         pagecounterstyle: discord.ButtonStyle = discord.ButtonStyle.grey,
         initial_page_number: int = 0,
         ephemeral: bool = False,
-        list_data: list[dict[str, Any]],
+        list_data: list[StickyEntry],
     ) -> None:
         super().__init__(timeout=timeout)
 
@@ -39,7 +40,7 @@ class StickyPagination(discord.ui.View):
 
         self.pages: list[discord.Embed] = []
 
-    async def construct_pages(self, list_data: list[dict[str, Any]]) -> None:  # noqa: PLR0912, FIX002 #TODO: Improve this
+    async def construct_pages(self, list_data: list[StickyEntry]) -> None:  # noqa: PLR0912, FIX002 #TODO: Improve this
         n_list = 10
 
         total_data = len(list_data)
@@ -80,7 +81,7 @@ class StickyPagination(discord.ui.View):
                         field_name = "_ _"
 
                     for sticky_data in sticky_data_list:
-                        row_string = f"<#{sticky_data['channel_id']}>\n"
+                        row_string = f"<#{sticky_data.channel_id}>\n"
                         field_value += row_string
 
                     embed.add_field(name=field_name, value=field_value)
@@ -58,6 +58,10 @@ class CustomRoleConfig:
     FONT_NOTO_CN = "bot/assets/font/NotoSansTC-Bold.ttf"
     FONT_SIZE = 30
 
+    COLOR_LIST_CACHE_DIR = "bot/data/color/"
+    COLOR_LIST_CACHE_SIZE = 16
+    COLOR_LIST_RENDER_WORKERS = 2
+
     BOOSTER_ROLE_ID = 768874803712753727
     BOOSTER_LOG_CHANNEL_ID = (
         774322083319775262 if config.BOT_DEBUG else 1008600026337005569
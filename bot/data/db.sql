@@ -61,6 +61,7 @@ CREATE TABLE temp_role (
     UNIQUE(user_id, role_id)
 );
 CREATE INDEX IF NOT EXISTS temp_role_user_role_idx ON temp_role (user_id, role_id);
+CREATE INDEX IF NOT EXISTS temp_role_end_time_idx ON temp_role (end_time);
 
 --- GIVEAWAY BLACKLIST FEATURE ----
 -----------------------------------
@@ -73,4 +74,16 @@ CREATE TABLE blacklist_ga(
 	PRIMARY KEY(user_id),
 	UNIQUE(user_id)
 );
-CREATE INDEX IF NOT EXISTS blacklist_ga_id_idx ON blacklist_ga (user_id);
\ No newline at end of file
+CREATE INDEX IF NOT EXISTS blacklist_ga_id_idx ON blacklist_ga (user_id);
+CREATE INDEX IF NOT EXISTS blacklist_ga_end_time_idx ON blacklist_ga (end_time) WHERE has_role;
+CREATE INDEX IF NOT EXISTS blacklist_ga_cooldown_time_idx ON blacklist_ga (cooldown_time);
+
+----- BOOSTER PAYOUT FEATURE -----
+----------------------------------
+CREATE TABLE booster_payout(
+	month DATE NOT NULL, -- first day of the payout month
+	member_id BIGINT NOT NULL,
+	status INT NOT NULL DEFAULT 0, -- 0: pending, 1: done, 2: failed, 3: unconfirmed
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+	PRIMARY KEY(month, member_id)
+);
@@ -1,8 +1,14 @@
-from collections.abc import Callable
+import asyncio
+import http
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TypeVar
 
+import discord
 from discord import Interaction, app_commands
 from discord.ext import commands
 
+T = TypeVar("T")
+
 
 def app_guard(
     *,
@@ -90,3 +96,42 @@ async def value_is_none(
         await ctx.send(f"{value} is not found")
     if interaction:
         await interaction.followup.send(f"{value} is not found", ephemeral=True)
+
+
+async def gather_bounded(
+    items: Iterable[T],
+    func: Callable[[T], Awaitable[object]],
+    *,
+    concurrency: int = 5,
+    retries: int = 3,
+    backoff: float = 1,
+) -> list[tuple[T, Exception | None]]:
+    """
+    Run `func` for every item with at most `concurrency` calls in flight.
+    Discord server errors are retried with exponential backoff, and each item is
+    returned with the exception it finally failed with, or None on success.
+    Rate limits are left to discord.py, which waits on its route buckets.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(item: T) -> tuple[T, Exception | None]:
+        attempt = 0
+        async with semaphore:
+            while True:
+                try:
+                    await func(item)
+                except discord.HTTPException as e:
+                    if (
+                        e.status < http.HTTPStatus.INTERNAL_SERVER_ERROR
+                        or attempt >= retries
+                    ):
+                        return item, e
+                except Exception as e:  # noqa: BLE001
+                    return item, e
+                else:
+                    return item, None
+
+                await asyncio.sleep(backoff * 2**attempt)
+                attempt += 1
+
+    return await asyncio.gather(*(run(item) for item in items))
@@ -7,3 +7,10 @@ class GuildScoreObject(TypedDict):
     guild_id: int
     score: int
     user_id: int
+
+
+@dataclass(slots=True)
+class BulkScoreResult:
+    user_id: int
+    score: GuildScoreObject | None = None
+    error: Exception | None = None
@@ -0,0 +1,79 @@
+import asyncio
+import time
+from collections.abc import Mapping
+
+UNIX_TIMESTAMP_THRESHOLD = 1_000_000_000
+
+
+class TokenBucket:
+    """
+    Asyncio token bucket shared by every request of one API key.
+    `acquire` waits for capacity instead of raising, and the bucket follows the
+    rate limit headers sent back by Tatsu.
+    """
+
+    def __init__(self, calls: int, period: float) -> None:
+        self.capacity = calls
+        self.rate = calls / period
+        self._tokens = float(calls)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        # the lock makes waiters take tokens in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def block_for(self, seconds: float) -> None:
+        """
+        Stop handing out tokens for `seconds`, e.g. after a 429 response.
+        """
+        self._tokens = 0.0
+        self._updated_at = time.monotonic()
+        self._blocked_until = max(self._blocked_until, self._updated_at + seconds)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Sync the bucket with `X-RateLimit-*` and `Retry-After` response headers.
+        """
+        if (retry_after := _parse_float(headers.get("Retry-After"))) is not None:
+            self.block_for(retry_after)
+            return
+
+        remaining = _parse_float(headers.get("X-RateLimit-Remaining"))
+        if remaining is None:
+            return
+
+        self._refill(time.monotonic())
+        self._tokens = min(self._tokens, remaining)
+        reset = _parse_float(headers.get("X-RateLimit-Reset"))
+        if remaining < 1 and reset is not None:
+            # Tatsu sends the reset time as a unix timestamp, accept a delay too
+            delay = reset - time.time() if reset > UNIX_TIMESTAMP_THRESHOLD else reset
+            self.block_for(max(0.0, delay))
+
+
+def _parse_float(value: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
@@ -1,32 +1,77 @@
+import asyncio
+import http
+import random
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import TypeVar, cast
 
 import aiohttp
-from ratelimit import limits
 
 import bot.module.tatsu.data_structures as ds
+from bot.module.tatsu.ratelimit import TokenBucket
 
 T = TypeVar("T")
 
+# Tatsu allows 60 requests per minute for each API key
+RATE_LIMIT_CALLS = 60
+RATE_LIMIT_PERIOD = 60
+MAX_RATE_LIMIT_RETRIES = 3
+DEFAULT_RETRY_AFTER = 5
+MAX_SERVER_ERROR_RETRIES = 3
+RETRY_BACKOFF = 1
+
+
+def is_unauthorized(error: BaseException) -> bool:
+    return (
+        isinstance(error, aiohttp.ClientResponseError)
+        and error.status == http.HTTPStatus.UNAUTHORIZED
+    )
+
 
 class ApiWrapper:
-    def __init__(self, key: str) -> None:
+    def __init__(self, key: str, session: aiohttp.ClientSession | None = None) -> None:
         self.key = key
         self.base_url = "https://api.tatsu.gg/v1/"
         self.headers = {"Authorization": key}
+        self._session = session
+        self._owns_session = session is None
+        self.bucket = TokenBucket(RATE_LIMIT_CALLS, RATE_LIMIT_PERIOD)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # created lazily because the wrapper may be built before the event loop runs
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=10, ttl_dns_cache=300, keepalive_timeout=60
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._owns_session = True
+        return self._session
+
+    async def close(self) -> None:
+        if self._owns_session and self._session and not self._session.closed:
+            await self._session.close()
 
-    @limits(calls=60, period=60)
     async def _patch(self, url: str, payload: dict, _: type[T]) -> T:
-        async with (
-            aiohttp.ClientSession() as session,
-            session.patch(
+        attempt = 0
+        while True:
+            await self.bucket.acquire()
+            async with self._get_session().patch(
                 url=self.base_url + url,
                 json=payload,
                 headers=self.headers,
-                raise_for_status=True,
-            ) as result,
-        ):
-            json_result = await result.json()
-            return cast("T", json_result)
+            ) as result:
+                self.bucket.update_from_headers(result.headers)
+                if (
+                    result.status == http.HTTPStatus.TOO_MANY_REQUESTS
+                    and attempt < MAX_RATE_LIMIT_RETRIES
+                ):
+                    if "Retry-After" not in result.headers:
+                        self.bucket.block_for(DEFAULT_RETRY_AFTER)
+                    attempt += 1
+                    continue
+
+                result.raise_for_status()
+                json_result = await result.json()
+                return cast("T", json_result)
 
     async def _modify_score(
         self, action_type: int, guild_id: int, user_id: int, amount: int
@@ -55,3 +100,100 @@ class ApiWrapper:
         self, guild_id: int, user_id: int, amount: int
     ) -> ds.GuildScoreObject:
         return await self._modify_score(1, guild_id, user_id, amount)
+
+    async def bulk_add_score(
+        self,
+        guild_id: int,
+        amounts: dict[int, int],
+        concurrency: int = 5,
+        on_start: Callable[[int], Awaitable[object]] | None = None,
+        retries: int = MAX_SERVER_ERROR_RETRIES,
+    ) -> AsyncIterator[ds.BulkScoreResult]:
+        """
+        Add score to many members, yielding a result for each one as it finishes.
+        Stops early when the API key is rejected, so members that were not
+        processed yet get no result. `on_start` is awaited with the user id right
+        before its request, and an error there skips the request.
+        A score may already be added when a server error or timeout is retried,
+        pass `retries=0` when paying twice is worse than failing.
+        """
+        pending: asyncio.Queue[tuple[int, int]] = asyncio.Queue()
+        for user_id, amount in amounts.items():
+            pending.put_nowait((user_id, amount))
+
+        results: asyncio.Queue[ds.BulkScoreResult | None] = asyncio.Queue()
+        unauthorized = asyncio.Event()
+
+        worker_count = max(1, min(concurrency, len(amounts)))
+        workers = [
+            asyncio.create_task(
+                self._bulk_add_score_worker(
+                    guild_id, pending, results, unauthorized, on_start, retries
+                )
+            )
+            for _ in range(worker_count)
+        ]
+        try:
+            finished = 0
+            while finished < worker_count:
+                result = await results.get()
+                if result is None:
+                    finished += 1
+                    continue
+                yield result
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _bulk_add_score_worker(
+        self,
+        guild_id: int,
+        pending: asyncio.Queue[tuple[int, int]],
+        results: asyncio.Queue[ds.BulkScoreResult | None],
+        unauthorized: asyncio.Event,
+        on_start: Callable[[int], Awaitable[object]] | None,
+        retries: int,
+    ) -> None:
+        while not unauthorized.is_set():
+            try:
+                user_id, amount = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+
+            try:
+                if on_start is not None:
+                    await on_start(user_id)
+                score = await self._add_score_with_retry(
+                    guild_id, user_id, amount, retries
+                )
+            except Exception as e:  # noqa: BLE001
+                if is_unauthorized(e):
+                    unauthorized.set()
+                await results.put(ds.BulkScoreResult(user_id, error=e))
+            else:
+                await results.put(ds.BulkScoreResult(user_id, score=score))
+
+        # tells the consumer this worker is done
+        await results.put(None)
+
+    async def _add_score_with_retry(
+        self, guild_id: int, user_id: int, amount: int, retries: int
+    ) -> ds.GuildScoreObject:
+        attempt = 0
+        while True:
+            try:
+                return await self.add_score(guild_id, user_id, amount)
+            except aiohttp.ClientResponseError as e:
+                if (
+                    e.status < http.HTTPStatus.INTERNAL_SERVER_ERROR
+                    or attempt >= retries
+                ):
+                    raise
+            except TimeoutError:
+                if attempt >= retries:
+                    raise
+
+            delay = RETRY_BACKOFF * 2**attempt
+            await asyncio.sleep(delay + random.uniform(0, delay))  # noqa: S311
+            attempt += 1
@@ -0,0 +1,111 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from bot.bot import WarnetBot
+
+logger = logging.getLogger(__name__)
+
+TIMER_RETRY_DELAY = 60
+
+# Handlers receive the time the timer fired at and sweep their own table for
+# everything that is due, so firing the same event twice is harmless. They return
+# the next deadline still in their table, which is how the timer is rescheduled.
+TimerHandler = Callable[[datetime], Awaitable[datetime | None]]
+
+
+class TimerService:
+    """
+    Timers shared by every cog.
+    Only the earliest deadline of each event is kept in memory, and a single task
+    sleeps until the next one is due. The domain tables are the source of truth:
+    a handler runs as soon as it is registered and returns its next deadline, so
+    nothing is lost when the bot restarts.
+    """
+
+    def __init__(self, bot: "WarnetBot") -> None:
+        self.bot = bot
+        self.handlers: dict[str, TimerHandler] = {}
+        self._deadlines: dict[str, datetime] = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def register(self, event: str, handler: TimerHandler) -> None:
+        self.handlers[event] = handler
+        # catches up on what was due while the bot or the cog was down
+        self.schedule(event, datetime.now(UTC))
+
+    def unregister(self, event: str) -> None:
+        self.handlers.pop(event, None)
+        self._deadlines.pop(event, None)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task:
+            self._task.cancel()
+            # a running handler must finish unwinding before the session is closed
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+    def schedule(self, event: str, expires_at: datetime) -> None:
+        """
+        Run the handler of `event` at `expires_at`, unless it already runs sooner.
+        """
+        current = self._deadlines.get(event)
+        if current is not None and current <= expires_at:
+            return
+
+        self._deadlines[event] = expires_at
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        await self.bot.wait_until_ready()
+        while True:
+            self._wakeup.clear()
+            if not self._deadlines:
+                await self._wakeup.wait()
+                continue
+
+            earliest = min(self._deadlines.values())
+            delay = (earliest - datetime.now(UTC)).total_seconds()
+            if delay > 0:
+                # woken early when a sooner timer is scheduled
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                continue
+
+            try:
+                await self._dispatch_due()
+            except Exception:
+                logger.exception("Failed to dispatch timers")
+
+    async def _dispatch_due(self) -> None:
+        now = datetime.now(UTC)
+        due = [
+            event for event, expires_at in self._deadlines.items() if expires_at <= now
+        ]
+        for event in due:
+            del self._deadlines[event]
+
+        for event in due:
+            if (handler := self.handlers.get(event)) is None:
+                # the owning cog sweeps again when it is registered
+                logger.warning("No handler for timer event", extra={"event": event})
+                continue
+
+            try:
+                next_deadline = await handler(now)
+            except Exception:
+                logger.exception("Timer handler failed", extra={"event": event})
+                next_deadline = now + timedelta(seconds=TIMER_RETRY_DELAY)
+
+            # the cog may have been unloaded while its handler was running
+            if next_deadline is not None and event in self.handlers:
+                self.schedule(event, next_deadline)
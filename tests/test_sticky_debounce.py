@@ -0,0 +1,49 @@
+import asyncio
+
+from bot.cogs.ext.sticky.debounce import MAX_WAIT_FACTOR, RepostScheduler
+
+DELAY = 0.1
+
+
+def _run_burst(gaps: list[float]) -> tuple[list[float], list[float]]:
+    """
+    Schedule one message after each gap and return the message and repost times.
+    """
+
+    async def burst() -> tuple[list[float], list[float]]:
+        loop = asyncio.get_running_loop()
+        scheduler = RepostScheduler()
+        start = loop.time()
+        messages: list[float] = []
+        reposts: list[float] = []
+
+        async def repost() -> None:
+            reposts.append(loop.time() - start)
+
+        for gap in gaps:
+            await asyncio.sleep(gap)
+            messages.append(loop.time() - start)
+            scheduler.schedule(1, DELAY, repost)
+
+        await asyncio.sleep(DELAY * (MAX_WAIT_FACTOR + 2))
+        scheduler.cancel_all()
+        return messages, reposts
+
+    return asyncio.run(burst())
+
+
+def test_repost_waits_for_quiet_period() -> None:
+    messages, reposts = _run_burst([0, DELAY * 0.9])
+
+    assert len(reposts) == 1
+    assert reposts[0] >= messages[-1] + DELAY
+
+
+def test_repost_is_capped_in_busy_channel() -> None:
+    gaps = [0] + [DELAY / 2] * (MAX_WAIT_FACTOR * 4)
+    messages, reposts = _run_burst(gaps)
+
+    assert reposts
+    assert reposts[0] < messages[-1]
+    assert reposts[0] >= DELAY * MAX_WAIT_FACTOR
+    assert reposts[0] < DELAY * (MAX_WAIT_FACTOR + 1)